@@ -148,6 +148,7 @@ public class CostumeTabController : BaseTabController
     // Costume monitor
     private CostumeMonitorConfig _costumeMonitorConfig = new();
     private readonly string _costumeMonitorConfigPath;
+    private readonly CoalescingFileWriter _costumeMonitorWriter;
     private List<(CostumeWatchItem Watch, List<DealItem> Matches)> _watchAlarmResults = new();
     private System.Windows.Forms.Timer? _alarmTimer;
     private bool _isSoundMuted = false;
@@ -188,6 +189,7 @@ public class CostumeTabController : BaseTabController
         var dataDir = Path.Combine(AppContext.BaseDirectory, "Data");
         Directory.CreateDirectory(dataDir);
         _costumeMonitorConfigPath = Path.Combine(dataDir, "CostumeMonitorConfig.json");
+        _costumeMonitorWriter = new CoalescingFileWriter(_costumeMonitorConfigPath);
     }
 
     /// <summary>
@@ -1247,15 +1249,36 @@ public class CostumeTabController : BaseTabController
         SetCrawlingState(_isCrawling);
 
         _autoCrawlTimer = new System.Windows.Forms.Timer { Interval = AutoCrawlIntervalMs };
-        _autoCrawlTimer.Tick += async (s, e) =>
-        {
-            if (!_isCrawling)
-                await RunIncrementalCrawlAsync();
-        };
-
-        // Immediately run the first crawl
-        _ = RunIncrementalCrawlAsync();
+        _autoCrawlTimer.Tick += async (s, e) => await RunAutoCrawlTickAsync();
         _autoCrawlTimer.Start();
+
+        // Immediately run the first crawl through the same single-run guard as the timer
+        _ = RunAutoCrawlTickAsync();
+    }
+
+    /// <summary>
+    /// Run one auto-crawl unless a crawl is already in progress.
+    /// The timer is paused for the duration of the crawl and restarted when it ends (success or error),
+    /// so the next run is always a full interval after the previous one and runs never overlap.
+    /// </summary>
+    private async Task RunAutoCrawlTickAsync()
+    {
+        if (_isCrawling) return;
+
+        var timer = _autoCrawlTimer;
+        timer?.Stop();
+        try
+        {
+            await RunIncrementalCrawlAsync();
+        }
+        finally
+        {
+            // A cancelled run (tab deactivated or auto-crawl stopped) leaves the timer paused for OnActivated.
+            // StopAutoCrawl disposes the timer, so only restart the one this run paused.
+            var cancelled = _crawlCts?.IsCancellationRequested ?? false;
+            if (_isAutoCrawling && !cancelled && timer != null && timer == _autoCrawlTimer)
+                timer.Start();
+        }
     }
 
     private void StopAutoCrawl()
@@ -1350,6 +1373,9 @@ public class CostumeTabController : BaseTabController
                     pageItemCount = result.Items.Count;
                     pageNewCount = 0;
 
+                    // One timestamp per page for CrawledAt/LastSeenAt instead of a clock read per item
+                    var pageTimestamp = DateTime.Now;
+
                     // Pass 1: process known/cache-hit items immediately; collect cache-miss items
                     var apiPendingItems = new List<DealItem>();
                     foreach (var item in result.Items)
@@ -1367,7 +1393,7 @@ public class CostumeTabController : BaseTabController
                             existing.Price = item.Price;
                             existing.PriceFormatted = null; // force recompute
                             existing.Quantity = item.Quantity;
-                            existing.CrawledAt = DateTime.Now;
+                            existing.CrawledAt = pageTimestamp;
                             existing.CrawledPage = currentPage;
                             existing.ComputeFields();
                             allItems.Add(existing);
@@ -1378,10 +1404,9 @@ public class CostumeTabController : BaseTabController
                                  && detailCache.TryGetValue(item.Ssi, out var cachedDetail))
                         {
                             // Cache hit: apply without API request, refresh TTL
-                            cachedDetail.LastSeenAt = DateTime.Now;
+                            cachedDetail.LastSeenAt = pageTimestamp;
                             item.ApplyDetailInfo(cachedDetail);
                             item.CrawledPage = currentPage;
-                            item.ComputeFields();
                             allItems.Add(item);
                             cacheHitCount++;
                             newCount++;
@@ -1410,12 +1435,11 @@ public class CostumeTabController : BaseTabController
                                         pendingItem.ServerId, pendingItem.MapId.Value, pendingItem.Ssi, ct);
                                     if (detail != null)
                                     {
-                                        detail.LastSeenAt = DateTime.Now;
+                                        detail.LastSeenAt = pageTimestamp;
                                         pendingItem.ApplyDetailInfo(detail);
                                         detailCache[pendingItem.Ssi!] = detail;
                                     }
                                 }
-                                pendingItem.ComputeFields();
                                 allItems.Add(pendingItem);
                                 newCount++;
                             }
@@ -1423,7 +1447,6 @@ public class CostumeTabController : BaseTabController
                             catch (Exception ex)
                             {
                                 Debug.WriteLine($"[CostumeTab] Parallel detail fetch failed: {ex.Message}");
-                                pendingItem.ComputeFields();
                                 allItems.Add(pendingItem);
                                 newCount++;
                             }
@@ -1514,17 +1537,17 @@ public class CostumeTabController : BaseTabController
                 IsIncremental = isIncremental
             };
 
-            await _crawlDataService.SaveAsync(session);
+            // Write the session file and the detail cache concurrently. The detail cache merge
+            // (merged with disk to preserve entries added by other tabs during crawl) is
+            // synchronous file I/O, so it runs on the thread pool instead of the UI thread.
+            var serverId = selectedServer.Id;
+            await Task.WhenAll(
+                _crawlDataService.SaveAsync(session),
+                Task.Run(() => _crawlDataService.MergeDetailCache(serverId, detailCache)));
+            detailCacheSaved = true;
             _currentSession = session;
             _btnSearch.Enabled = true;
 
-            // Save detail cache — merge with disk to preserve entries added by other tabs during crawl
-            var freshCache = _crawlDataService.LoadDetailCache(selectedServer.Id);
-            foreach (var kvp in detailCache)
-                freshCache[kvp.Key] = kvp.Value;
-            _crawlDataService.SaveDetailCache(selectedServer.Id, freshCache);
-            detailCacheSaved = true;
-
             // Clean up old timestamped files only after successful complete crawl
             _crawlDataService.CleanupOldTimestampedFiles(CrawlSearchTerm, selectedServer.Name);
 
@@ -1541,13 +1564,6 @@ public class CostumeTabController : BaseTabController
 
             // Check watch conditions after crawl completes
             CheckWatchConditions();
-
-            // Restart timer from now so next crawl is exactly 5 min after completion
-            if (_isAutoCrawling && _autoCrawlTimer != null)
-            {
-                _autoCrawlTimer.Stop();
-                _autoCrawlTimer.Start();
-            }
         }
         catch (OperationCanceledException)
         {
@@ -1596,10 +1612,7 @@ public class CostumeTabController : BaseTabController
             // Save detail cache on partial exit — merge with disk to preserve entries from other tabs
             if (!detailCacheSaved && detailCache.Count > 0)
             {
-                var partialFreshCache = _crawlDataService.LoadDetailCache(selectedServer.Id);
-                foreach (var kvp in detailCache)
-                    partialFreshCache[kvp.Key] = kvp.Value;
-                _crawlDataService.SaveDetailCache(selectedServer.Id, partialFreshCache);
+                _crawlDataService.MergeDetailCache(selectedServer.Id, detailCache);
             }
 
             _crawlProgressBar.Visible = false;
@@ -2399,18 +2412,24 @@ public class CostumeTabController : BaseTabController
             if (string.IsNullOrWhiteSpace(watch.StoneName) && string.IsNullOrWhiteSpace(watch.ItemName)) continue;
             if (watch.WatchPrice <= 0) continue;
 
+            // Bind the watch's conditions once; the predicate below runs for every session item
+            var watchPrice = watch.WatchPrice;
+            var stoneParts = string.IsNullOrWhiteSpace(watch.StoneName) ? null : SearchHelper.SplitWildcard(watch.StoneName);
+            var itemParts = string.IsNullOrWhiteSpace(watch.ItemName) ? null : SearchHelper.SplitWildcard(watch.ItemName);
+
             var matches = _currentSession.Items.Where(item =>
             {
+                // Cheapest check first
+                if (item.Price > watchPrice) return false;
+
                 // Check stone name match (supports % wildcard)
-                bool stoneMatch = string.IsNullOrWhiteSpace(watch.StoneName) ||
+                bool stoneMatch = stoneParts == null ||
                     (item.SlotInfo != null && item.SlotInfo.Any(s =>
-                        SearchHelper.WildcardContains(s, watch.StoneName)));
+                        SearchHelper.WildcardContains(s, stoneParts)));
 
                 // Check item name match (supports % wildcard)
-                bool itemMatch = string.IsNullOrWhiteSpace(watch.ItemName) ||
-                    SearchHelper.WildcardContains(item.ItemName, watch.ItemName);
-
-                return stoneMatch && itemMatch && item.Price <= watch.WatchPrice;
+                return stoneMatch && (itemParts == null ||
+                    SearchHelper.WildcardContains(item.ItemName, itemParts));
             }).ToList();
 
             if (matches.Count > 0)
@@ -2545,7 +2564,11 @@ public class CostumeTabController : BaseTabController
 
             var configToSave = new CostumeMonitorConfig { Items = itemsToSave };
             var json = JsonSerializer.Serialize(configToSave, _monitorSaveOptions);
-            await File.WriteAllTextAsync(_costumeMonitorConfigPath, json);
+            var version = _costumeMonitorWriter.NextVersion();
+
+            if (!await _costumeMonitorWriter.WriteAsync(json, version))
+                return;
+
             Debug.WriteLine($"[CostumeTab] Saved {itemsToSave.Count} watch items");
         }
         catch (Exception ex)
@@ -2573,12 +2596,11 @@ public class CostumeTabController : BaseTabController
         // Always try to load and display data on tab activation
         await TryLoadLatestDataAsync(autoDisplay: true);
 
-        // Resume auto-crawl: immediately trigger a crawl, then restart the timer
+        // Resume auto-crawl: restart the timer, then immediately trigger a crawl through the single-run guard
         if (_isAutoCrawling && _autoCrawlTimer != null && !_autoCrawlTimer.Enabled)
         {
-            if (!_isCrawling)
-                _ = RunIncrementalCrawlAsync();
             _autoCrawlTimer.Start();
+            _ = RunAutoCrawlTickAsync();
         }
     }
 
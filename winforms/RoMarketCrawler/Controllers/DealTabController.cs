@@ -1,3 +1,4 @@
+using System.Collections.Frozen;
 using System.Diagnostics;
 using RoMarketCrawler.Controls;
 using RoMarketCrawler.Exceptions;
@@ -19,7 +20,7 @@ public class DealTabController : BaseTabController
     private const int DetailRequestDelayMs = 1000;  // 1 second per item (to avoid rate limiting)
 
     // Item types that have enchant/card/random options (무기, 방어구, 쉐도우, 의상)
-    private static readonly HashSet<int> EquipmentItemTypes = new() { 4, 5, 19, 20 };
+    private static readonly FrozenSet<int> EquipmentItemTypes = new[] { 4, 5, 19, 20 }.ToFrozenSet();
 
     #endregion
 
@@ -749,12 +750,6 @@ public class DealTabController : BaseTabController
             _totalCount = result.TotalCount;
             _totalPages = result.TotalPages;
 
-            // Compute display fields
-            foreach (var item in items)
-            {
-                item.ComputeFields();
-            }
-
             // Load details sequentially BEFORE showing results
             var equipmentItems = items.Where(i => i.HasDetailParams && IsEquipmentItem(i)).ToList();
             if (equipmentItems.Count > 0)
@@ -829,6 +824,9 @@ public class DealTabController : BaseTabController
         var total = equipmentItems.Count;
         var loaded = 0;
         var cacheHits = 0;
+        // End time of the last API request. The spacing delay is taken lazily right before the
+        // next API request, so cache hits and the end of the list don't wait for it.
+        long? lastRequestEndMs = null;
 
         foreach (var item in equipmentItems)
         {
@@ -847,11 +845,22 @@ public class DealTabController : BaseTabController
                 }
                 else
                 {
+                    // Keep at least DetailRequestDelayMs between API requests
+                    if (lastRequestEndMs.HasValue)
+                    {
+                        var waitMs = DetailRequestDelayMs - (Environment.TickCount64 - lastRequestEndMs.Value);
+                        if (waitMs > 0)
+                        {
+                            await Task.Delay((int)waitMs, cancellationToken);
+                        }
+                    }
+
                     var detail = await _gnjoyClient.FetchItemDetailAsync(
                         item.ServerId,
                         item.MapId!.Value,
                         item.Ssi!,
                         cancellationToken);
+                    lastRequestEndMs = Environment.TickCount64;
 
                     if (detail != null && IsCurrentSearch())
                     {
@@ -863,12 +872,6 @@ public class DealTabController : BaseTabController
                     }
 
                     loaded++;
-
-                    // Delay between API requests only
-                    if (loaded < total && IsCurrentSearch())
-                    {
-                        await Task.Delay(DetailRequestDelayMs, cancellationToken);
-                    }
                 }
 
                 // Update progress
@@ -896,10 +899,12 @@ public class DealTabController : BaseTabController
             }
         }
 
-        // Save cache after loading completes
+        // Save cache after loading completes. Runs in the background so the search results
+        // are shown without waiting on the cache file write; merging keeps entries other tabs
+        // saved while details were loading.
         if (serverId > 0 && detailCache.Count > 0)
         {
-            _crawlDataService.SaveDetailCache(serverId, detailCache);
+            _ = Task.Run(() => _crawlDataService.MergeDetailCache(serverId, detailCache));
         }
 
         Debug.WriteLine($"[DealTabController] Loaded {loaded}/{total} item details (cache hits: {cacheHits})");
@@ -4,6 +4,7 @@ using RoMarketCrawler.Controls;
 using RoMarketCrawler.Interfaces;
 using RoMarketCrawler.Models;
 using RoMarketCrawler.Services;
+using RoMarketCrawler.Startup;
 
 namespace RoMarketCrawler.Controllers;
 
@@ -89,7 +90,7 @@ public class ItemTabController : BaseTabController
         _itemBindingSource = new BindingSource { DataSource = _itemResults };
 
         // Initialize HttpClient with required headers (same as ItemDetailForm)
-        _imageHttpClient = new HttpClient();
+        _imageHttpClient = new HttpClient { MaxResponseContentBufferSize = HttpClientConfiguration.MaxImageResponseBytes };
         _imageHttpClient.DefaultRequestHeaders.UserAgent.ParseAdd("Mozilla/5.0");
         _imageHttpClient.DefaultRequestHeaders.Referrer = new Uri("https://ro.gnjoy.com/");
 
@@ -939,8 +940,6 @@ public class ItemTabController : BaseTabController
         if (!checkedFilters.Any())
             return items;
 
-        var result = items;
-
         var filterCategories = new Dictionary<string, FilterTarget>();
         foreach (var typeId in _selectedItemTypes)
         {
@@ -951,6 +950,9 @@ public class ItemTabController : BaseTabController
             }
         }
 
+        // Collect one regex per category, then filter in a single pass instead of
+        // copying the (possibly whole-index) result list once per category
+        var activeFilters = new List<(FilterTarget Target, Regex Regex)>();
         foreach (var categoryGroup in checkedFilters)
         {
             var categoryName = categoryGroup.Key;
@@ -962,8 +964,27 @@ public class ItemTabController : BaseTabController
             if (string.IsNullOrEmpty(combinedPattern))
                 continue;
 
-            var regex = new Regex(combinedPattern, RegexOptions.IgnoreCase);
-            result = result.Where(item => MatchesFilter(item, target, regex)).ToList();
+            activeFilters.Add((target, new Regex(combinedPattern, RegexOptions.IgnoreCase)));
+        }
+
+        if (activeFilters.Count == 0)
+            return items;
+
+        var result = new List<KafraItem>();
+        foreach (var item in items)
+        {
+            var matchesAll = true;
+            foreach (var (target, regex) in activeFilters)
+            {
+                if (!MatchesFilter(item, target, regex))
+                {
+                    matchesAll = false;
+                    break;
+                }
+            }
+
+            if (matchesAll)
+                result.Add(item);
         }
 
         return result;
@@ -1,4 +1,5 @@
 using System.Collections.Concurrent;
+using System.Collections.Frozen;
 using System.Diagnostics;
 using RoMarketCrawler.Controls;
 using RoMarketCrawler.Interfaces;
@@ -17,6 +18,26 @@ public class MonitorTabController : BaseTabController
 
     private const int QueueProcessDelayMs = 500;
 
+    // Grade colors, matched case-insensitively without lowercasing the grade on every cell paint
+    private static readonly FrozenDictionary<string, Color> _darkGradeColors = new Dictionary<string, Color>(StringComparer.OrdinalIgnoreCase)
+    {
+        ["s"] = Color.FromArgb(255, 200, 50),
+        ["a"] = Color.FromArgb(200, 130, 255),
+        ["b"] = Color.FromArgb(80, 180, 255),
+        ["c"] = Color.FromArgb(100, 220, 100),
+        ["d"] = Color.FromArgb(160, 160, 160),
+        ["unique"] = Color.FromArgb(255, 180, 0)
+    }.ToFrozenDictionary(StringComparer.OrdinalIgnoreCase);
+    private static readonly FrozenDictionary<string, Color> _lightGradeColors = new Dictionary<string, Color>(StringComparer.OrdinalIgnoreCase)
+    {
+        ["s"] = Color.FromArgb(180, 140, 0),
+        ["a"] = Color.FromArgb(130, 0, 130),
+        ["b"] = Color.FromArgb(0, 100, 180),
+        ["c"] = Color.FromArgb(0, 130, 0),
+        ["d"] = Color.FromArgb(110, 110, 110),
+        ["unique"] = Color.FromArgb(180, 100, 0)
+    }.ToFrozenDictionary(StringComparer.OrdinalIgnoreCase);
+
     #endregion
 
     #region Services
@@ -1228,10 +1249,9 @@ public class MonitorTabController : BaseTabController
 
         if (result == DialogResult.Yes)
         {
-            foreach (var item in itemsToDelete)
-            {
-                await _monitoringService.RemoveItemAsync(item.ItemName, item.ServerId);
-            }
+            // Remove the whole selection in one batch so the config is serialized and written once
+            await _monitoringService.RemoveItemsAsync(
+                itemsToDelete.Select(item => (item.ItemName, item.ServerId)));
             UpdateMonitorItemList();
             UpdateMonitorResults();
         }
@@ -1600,6 +1620,7 @@ public class MonitorTabController : BaseTabController
 
         var items = _monitoringService.Config.Items;
         var isAutoRefreshEnabled = _monitorTimer.Enabled;
+        var now = DateTime.Now; // One clock read per refresh of the column, shared by every row
 
         for (int i = 0; i < _dgvMonitorItems.Rows.Count && i < items.Count; i++)
         {
@@ -1617,7 +1638,7 @@ public class MonitorTabController : BaseTabController
                 statusCell.Value = "-";
             else if (item.NextRefreshTime.HasValue)
             {
-                var remaining = (item.NextRefreshTime.Value - DateTime.Now).TotalSeconds;
+                var remaining = (item.NextRefreshTime.Value - now).TotalSeconds;
                 statusCell.Value = remaining > 0 ? $"{(int)remaining}초 후" : "대기";
             }
             else
@@ -2118,29 +2139,15 @@ public class MonitorTabController : BaseTabController
         {
             if (_currentTheme == ThemeType.Dark)
             {
-                e.CellStyle!.ForeColor = grade.ToLowerInvariant() switch
-                {
-                    "s" => Color.FromArgb(255, 200, 50),
-                    "a" => Color.FromArgb(200, 130, 255),
-                    "b" => Color.FromArgb(80, 180, 255),
-                    "c" => Color.FromArgb(100, 220, 100),
-                    "d" => Color.FromArgb(160, 160, 160),
-                    "unique" => Color.FromArgb(255, 180, 0),
-                    _ => Color.FromArgb(200, 200, 200)
-                };
+                e.CellStyle!.ForeColor = _darkGradeColors.TryGetValue(grade, out var color)
+                    ? color
+                    : Color.FromArgb(200, 200, 200);
             }
             else
             {
-                e.CellStyle!.ForeColor = grade.ToLowerInvariant() switch
-                {
-                    "s" => Color.FromArgb(180, 140, 0),
-                    "a" => Color.FromArgb(130, 0, 130),
-                    "b" => Color.FromArgb(0, 100, 180),
-                    "c" => Color.FromArgb(0, 130, 0),
-                    "d" => Color.FromArgb(110, 110, 110),
-                    "unique" => Color.FromArgb(180, 100, 0),
-                    _ => Color.FromArgb(80, 80, 80)
-                };
+                e.CellStyle!.ForeColor = _lightGradeColors.TryGetValue(grade, out var color)
+                    ? color
+                    : Color.FromArgb(80, 80, 80);
             }
             e.CellStyle.Font = _cachedBoldCellFont;
         }
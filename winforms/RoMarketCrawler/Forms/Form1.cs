@@ -193,11 +193,11 @@ public partial class Form1 : Form
     {
         try
         {
-            // Load item index
-            await _itemTabController.LoadItemIndexAsync();
-
-            // Load monitoring config and reset auto-refresh state
-            await _monitorTabController.LoadMonitoringAsync();
+            // Load item index and monitoring config (with auto-refresh reset) concurrently.
+            // The two files are independent and each controller handles its own errors.
+            await Task.WhenAll(
+                _itemTabController.LoadItemIndexAsync(),
+                _monitorTabController.LoadMonitoringAsync());
 
             // Initialize WebView2 for Cloudflare bypass
             await InitializeWebView2Async();
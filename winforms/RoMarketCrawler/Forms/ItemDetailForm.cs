@@ -5,6 +5,7 @@ using System.Text;
 using System.Text.RegularExpressions;
 using RoMarketCrawler.Models;
 using RoMarketCrawler.Services;
+using RoMarketCrawler.Startup;
 
 namespace RoMarketCrawler;
 
@@ -62,7 +63,7 @@ public class ItemDetailForm : Form
         _itemIndexService = itemIndexService;
         _theme = theme;
         _baseFontSize = baseFontSize;
-        _imageClient = new HttpClient();
+        _imageClient = new HttpClient { MaxResponseContentBufferSize = HttpClientConfiguration.MaxImageResponseBytes };
         _imageClient.DefaultRequestHeaders.UserAgent.ParseAdd("Mozilla/5.0");
         _imageClient.DefaultRequestHeaders.Referrer = new Uri("https://ro.gnjoy.com/");
 
@@ -2,6 +2,7 @@ using System.Diagnostics;
 using System.Runtime.InteropServices;
 using RoMarketCrawler.Models;
 using RoMarketCrawler.Services;
+using RoMarketCrawler.Startup;
 
 namespace RoMarketCrawler;
 
@@ -59,7 +60,7 @@ public class ItemInfoForm : Form
         _itemIndexService = itemIndexService;
         _theme = theme;
         _baseFontSize = baseFontSize;
-        _imageClient = new HttpClient();
+        _imageClient = new HttpClient { MaxResponseContentBufferSize = HttpClientConfiguration.MaxImageResponseBytes };
         _imageClient.DefaultRequestHeaders.UserAgent.ParseAdd("Mozilla/5.0");
         _imageClient.DefaultRequestHeaders.Referrer = new Uri("https://ro.gnjoy.com/");
 
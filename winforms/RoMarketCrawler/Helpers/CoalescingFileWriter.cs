@@ -0,0 +1,44 @@
+namespace RoMarketCrawler.Helpers;
+
+/// <summary>
+/// Writes a file one snapshot at a time, dropping snapshots that a newer save has superseded.
+/// Bursts of fire-and-forget saves collapse into a single write of the latest state.
+/// </summary>
+public sealed class CoalescingFileWriter
+{
+    private readonly string _filePath;
+    private readonly SemaphoreSlim _writeLock = new(1, 1);
+    private long _version;
+
+    public CoalescingFileWriter(string filePath)
+    {
+        _filePath = filePath;
+    }
+
+    /// <summary>
+    /// Reserve a version for a snapshot. Take it together with the snapshot
+    /// so a newer version always carries a newer snapshot.
+    /// </summary>
+    public long NextVersion() => Interlocked.Increment(ref _version);
+
+    /// <summary>
+    /// Write the snapshot unless a newer version was reserved while it waited.
+    /// Returns false when the write was skipped.
+    /// </summary>
+    public async Task<bool> WriteAsync(string contents, long version)
+    {
+        await _writeLock.WaitAsync();
+        try
+        {
+            if (version != Interlocked.Read(ref _version))
+                return false;
+
+            await File.WriteAllTextAsync(_filePath, contents);
+            return true;
+        }
+        finally
+        {
+            _writeLock.Release();
+        }
+    }
+}
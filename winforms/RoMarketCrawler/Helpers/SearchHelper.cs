@@ -13,9 +13,24 @@ public static class SearchHelper
     /// </summary>
     public static bool WildcardContains(string? text, string pattern)
     {
-        if (string.IsNullOrEmpty(text)) return false;
+        return WildcardContains(text, SplitWildcard(pattern));
+    }
 
-        var parts = pattern.Split('%', StringSplitOptions.RemoveEmptyEntries);
+    /// <summary>
+    /// Split a % wildcard pattern into the parts matched by <see cref="WildcardContains(string?, string[])"/>.
+    /// Callers matching one pattern against many texts split it once up front.
+    /// </summary>
+    public static string[] SplitWildcard(string pattern)
+    {
+        return pattern.Split('%', StringSplitOptions.RemoveEmptyEntries);
+    }
+
+    /// <summary>
+    /// Check if <paramref name="text"/> contains every part, in order (a pre-split wildcard pattern).
+    /// </summary>
+    public static bool WildcardContains(string? text, string[] parts)
+    {
+        if (string.IsNullOrEmpty(text)) return false;
         if (parts.Length == 0) return true;
 
         int searchFrom = 0;
@@ -59,6 +59,12 @@ public interface IMonitoringService : IDisposable
     /// </summary>
     Task<bool> RemoveItemAsync(string itemName, int serverId = -1);
 
+    /// <summary>
+    /// Remove several items from the monitoring list with a single config save
+    /// </summary>
+    /// <returns>Number of items removed</returns>
+    Task<int> RemoveItemsAsync(IEnumerable<(string ItemName, int ServerId)> items);
+
     /// <summary>
     /// Update the server ID of an existing monitored item
     /// </summary>
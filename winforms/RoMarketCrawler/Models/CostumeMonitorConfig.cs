@@ -17,5 +17,5 @@ public class CostumeWatchItem
     public string ItemName { get; set; } = string.Empty;
     public long WatchPrice { get; set; }
     public bool Enabled { get; set; } = true;
-    public DateTime AddedAt { get; set; } = DateTime.Now;
+    public DateTime AddedAt { get; set; }  // Set by AddWatchItem; loaded items keep their saved value
 }
@@ -1,3 +1,5 @@
+using System.Text.Json.Serialization;
+
 namespace RoMarketCrawler.Models;
 
 /// <summary>
@@ -20,16 +22,37 @@ public class DealItem
     public string? DealType { get; set; }
     public string ShopName { get; set; } = string.Empty;
     public string? MapName { get; set; }
-    public DateTime CrawledAt { get; set; } = DateTime.Now;
+    public DateTime CrawledAt { get; set; }  // Set by ItemDealParser once per parsed page
     public int? CrawledPage { get; set; }  // Page number where this item was crawled
 
     // Item detail view parameters (for fetching enchant/card info)
     public int? MapId { get; set; }
     public string? Ssi { get; set; }  // Unique item identifier for itemDealView.asp
 
-    // Enchant and card info from item detail view
-    public List<string> SlotInfo { get; set; } = new();  // 인챈트/카드 목록
-    public List<string> RandomOptions { get; set; } = new();  // 랜덤 옵션 목록
+    // Enchant and card info from item detail view.
+    // Populate: loading a session fills these lists instead of allocating a replacement per item.
+    [JsonObjectCreationHandling(JsonObjectCreationHandling.Populate)]
+    public List<string> SlotInfo  // 인챈트/카드 목록
+    {
+        get => _slotInfo;
+        set
+        {
+            _slotInfo = value;
+            _slotAndOptionsDisplay = null;
+        }
+    }
+    [JsonObjectCreationHandling(JsonObjectCreationHandling.Populate)]
+    public List<string> RandomOptions  // 랜덤 옵션 목록
+    {
+        get => _randomOptions;
+        set
+        {
+            _randomOptions = value;
+            _slotAndOptionsDisplay = null;
+        }
+    }
+    private List<string> _slotInfo = new();
+    private List<string> _randomOptions = new();
     public string? Element { get; set; }  // 속성 (e.g., "무속성 : 0")
     public string? Maker { get; set; }  // 제조자
 
@@ -52,20 +75,32 @@ public class DealItem
         // Note: No space between grade/refine and item name (matches original game format)
         if (string.IsNullOrEmpty(DisplayName))
         {
-            var sb = new System.Text.StringBuilder();
+            var hasGrade = !string.IsNullOrEmpty(Grade);
+            var hasRefine = Refine.HasValue && Refine > 0;
+            var hasCardSlots = !string.IsNullOrEmpty(CardSlots);
 
-            if (!string.IsNullOrEmpty(Grade))
+            // Runs once per parsed row: plain items display as the bare name, and the rest
+            // append their parts directly instead of building interpolated fragments first
+            if (!hasGrade && !hasRefine && !hasCardSlots)
             {
-                sb.Append($"[{Grade}]");
+                DisplayName = ItemName;
+                return;
             }
-            if (Refine.HasValue && Refine > 0)
+
+            var sb = new System.Text.StringBuilder(ItemName.Length + 16);
+
+            if (hasGrade)
             {
-                sb.Append($"+{Refine}");
+                sb.Append('[').Append(Grade).Append(']');
+            }
+            if (hasRefine)
+            {
+                sb.Append('+').Append(Refine!.Value);
             }
             sb.Append(ItemName);
-            if (!string.IsNullOrEmpty(CardSlots))
+            if (hasCardSlots)
             {
-                sb.Append($"[{CardSlots}]");
+                sb.Append('[').Append(CardSlots).Append(']');
             }
             DisplayName = sb.ToString();
         }
@@ -97,6 +132,10 @@ public class DealItem
     public string RandomOptionsDisplay =>
         RandomOptions?.Count > 0 ? string.Join(", ", RandomOptions) : "-";
 
+    // The grid reads SlotAndOptionsDisplay on every paint and row measure; join once and reuse it.
+    // Cleared by the SlotInfo/RandomOptions setters.
+    private string? _slotAndOptionsDisplay;
+
     /// <summary>
     /// Combined display for cards, enchants, and random options
     /// </summary>
@@ -104,6 +143,9 @@ public class DealItem
     {
         get
         {
+            if (_slotAndOptionsDisplay != null)
+                return _slotAndOptionsDisplay;
+
             var parts = new List<string>();
 
             if (SlotInfo?.Count > 0)
@@ -112,7 +154,8 @@ public class DealItem
             if (RandomOptions?.Count > 0)
                 parts.AddRange(RandomOptions);
 
-            return parts.Count > 0 ? string.Join(Environment.NewLine, parts) : "-";
+            _slotAndOptionsDisplay = parts.Count > 0 ? string.Join(Environment.NewLine, parts) : "-";
+            return _slotAndOptionsDisplay;
         }
     }
 
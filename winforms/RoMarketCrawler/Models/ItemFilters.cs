@@ -1,3 +1,5 @@
+using System.Collections.Frozen;
+
 namespace RoMarketCrawler.Models;
 
 /// <summary>
@@ -137,37 +139,40 @@ public static class ItemFilters
         new FilterOption("도람", "도람|수라")
     };
 
+    // Filter categories per item type, built once (after the option arrays above).
+    // Sub-filtering looks these up on every search, so don't rebuild the arrays per call.
+    private static readonly FrozenDictionary<int, FilterCategory[]> _filtersByType = new Dictionary<int, FilterCategory[]>
+    {
+        [4] = new[] // 무기
+        {
+            new FilterCategory("무기 종류", WeaponTypes, FilterTarget.ItemText),
+            new FilterCategory("직업군", JobClasses, FilterTarget.EquipJobsText)
+        },
+        [5] = new[] // 방어구
+        {
+            new FilterCategory("방어구 위치", ArmorPositions, FilterTarget.ItemText),
+            new FilterCategory("직업군", JobClasses, FilterTarget.EquipJobsText)
+        },
+        [6] = new[] // 카드
+        {
+            new FilterCategory("카드 위치", CardPositions, FilterTarget.ItemText)
+        },
+        [19] = new[] // 쉐도우
+        {
+            new FilterCategory("쉐도우 위치", ShadowPositions, FilterTarget.ScreenName)
+        },
+        [20] = new[] // 의상
+        {
+            new FilterCategory("의상 위치", CostumePositions, FilterTarget.ItemText)
+        }
+    }.ToFrozenDictionary();
+
     /// <summary>
     /// Get filter options for a given item type
     /// </summary>
     public static FilterCategory[] GetFiltersForType(int itemType)
     {
-        return itemType switch
-        {
-            4 => new[] // 무기
-            {
-                new FilterCategory("무기 종류", WeaponTypes, FilterTarget.ItemText),
-                new FilterCategory("직업군", JobClasses, FilterTarget.EquipJobsText)
-            },
-            5 => new[] // 방어구
-            {
-                new FilterCategory("방어구 위치", ArmorPositions, FilterTarget.ItemText),
-                new FilterCategory("직업군", JobClasses, FilterTarget.EquipJobsText)
-            },
-            6 => new[] // 카드
-            {
-                new FilterCategory("카드 위치", CardPositions, FilterTarget.ItemText)
-            },
-            19 => new[] // 쉐도우
-            {
-                new FilterCategory("쉐도우 위치", ShadowPositions, FilterTarget.ScreenName)
-            },
-            20 => new[] // 의상
-            {
-                new FilterCategory("의상 위치", CostumePositions, FilterTarget.ItemText)
-            },
-            _ => Array.Empty<FilterCategory>()
-        };
+        return _filtersByType.TryGetValue(itemType, out var filters) ? filters : Array.Empty<FilterCategory>();
     }
 }
 
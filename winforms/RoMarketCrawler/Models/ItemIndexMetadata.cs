@@ -1,3 +1,4 @@
+using System.Collections.Frozen;
 using System.Text.Json.Serialization;
 using RoMarketCrawler.Services;
 
@@ -156,7 +157,7 @@ public static class ItemTypes
     /// <summary>
     /// Known item type names in Korean (from kafra.kr URL structure)
     /// </summary>
-    public static readonly Dictionary<int, string> TypeNames = new()
+    public static readonly FrozenDictionary<int, string> TypeNames = new Dictionary<int, string>
     {
         { 0, "힐링 아이템" },
         { 2, "사용 아이템" },
@@ -173,7 +174,7 @@ public static class ItemTypes
         { 20, "의상" },
         { 998, "기타" },
         { 999, "전체" }
-    };
+    }.ToFrozenDictionary();
 
     public static string GetTypeName(int type)
     {
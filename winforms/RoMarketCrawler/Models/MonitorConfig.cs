@@ -50,9 +50,9 @@ namespace RoMarketCrawler.Models
         public bool ExactMatch { get; set; } = false;
 
         /// <summary>
-        /// When this item was added to monitoring list
+        /// When this item was added to monitoring list (set by AddItemAsync; loaded items keep their saved value)
         /// </summary>
-        public DateTime AddedAt { get; set; } = DateTime.Now;
+        public DateTime AddedAt { get; set; }
 
         /// <summary>
         /// Watch price threshold - alert when current price drops below this (null = disabled)
@@ -141,9 +141,9 @@ namespace RoMarketCrawler.Models
         public bool IsGoodDeal => IsBelowYesterdayAvg && IsBelowWeekAvg;
 
         /// <summary>
-        /// Last refresh time
+        /// Last refresh time (set by the refresh that produced this result)
         /// </summary>
-        public DateTime LastRefreshed { get; set; } = DateTime.Now;
+        public DateTime LastRefreshed { get; set; }
 
         /// <summary>
         /// Error message if refresh failed
@@ -69,20 +69,34 @@ public class PriceStatistics
         var yesterday = today.AddDays(-1);
         var weekAgo = today.AddDays(-7);
 
-        // Find yesterday's data
-        var yesterdayData = history.FirstOrDefault(h => h.Date.Date == yesterday);
-        if (yesterdayData != null)
+        // Yesterday's data and 7-day statistics in a single pass over the history
+        long weekSum = 0;
+        int weekCount = 0;
+        long weekMin = long.MaxValue;
+        long weekMax = long.MinValue;
+
+        foreach (var h in history)
         {
-            stats.YesterdayAvgPrice = yesterdayData.AvgPrice;
+            // First match wins, same as FirstOrDefault
+            if (stats.YesterdayAvgPrice == null && h.Date.Date == yesterday)
+            {
+                stats.YesterdayAvgPrice = h.AvgPrice;
+            }
+
+            if (h.Date >= weekAgo)
+            {
+                weekSum += h.AvgPrice;
+                weekCount++;
+                if (h.MinPrice < weekMin) weekMin = h.MinPrice;
+                if (h.MaxPrice > weekMax) weekMax = h.MaxPrice;
+            }
         }
 
-        // Calculate 7-day statistics
-        var weekData = history.Where(h => h.Date >= weekAgo).ToList();
-        if (weekData.Count > 0)
+        if (weekCount > 0)
         {
-            stats.Week7AvgPrice = (long)weekData.Average(h => h.AvgPrice);
-            stats.Week7MinPrice = weekData.Min(h => h.MinPrice);
-            stats.Week7MaxPrice = weekData.Max(h => h.MaxPrice);
+            stats.Week7AvgPrice = (long)((double)weekSum / weekCount);
+            stats.Week7MinPrice = weekMin;
+            stats.Week7MaxPrice = weekMax;
         }
 
         return stats;
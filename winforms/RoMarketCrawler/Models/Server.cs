@@ -1,3 +1,5 @@
+using System.Collections.Frozen;
+
 namespace RoMarketCrawler.Models;
 
 /// <summary>
@@ -19,17 +21,17 @@ public class Server
     };
 
     // GNJOY internal ID mapping
-    private static readonly Dictionary<int, int> _gnjoyToApiMap = new()
+    private static readonly FrozenDictionary<int, int> _gnjoyToApiMap = new Dictionary<int, int>
     {
         { 129, 1 },
         { 229, 2 },
         { 529, 3 },
         { 729, 4 },
-    };
+    }.ToFrozenDictionary();
 
-    // Lazy-initialized lookup dictionary
-    private static Dictionary<int, string>? _serverNames;
-    public static Dictionary<int, string> ServerNames => _serverNames ??= BuildServerNames();
+    // Lookup dictionary, built once at type initialization (after _servers/_gnjoyToApiMap above).
+    // GetServerName runs per parsed deal row and per monitor grid cell, so skip the lazy null check.
+    public static Dictionary<int, string> ServerNames { get; } = BuildServerNames();
 
     private static Dictionary<int, string> BuildServerNames()
     {
@@ -49,6 +51,20 @@ public class Server
         return dict;
     }
 
+    // Reverse lookup (name -> first ID in ServerNames order), built after ServerNames above.
+    // Lets deal parsing resolve the usual exact server cell text without scanning every entry.
+    private static readonly FrozenDictionary<string, int> _idByName = BuildIdByName();
+
+    private static FrozenDictionary<string, int> BuildIdByName()
+    {
+        var dict = new Dictionary<string, int>();
+        foreach (var (id, name) in ServerNames)
+        {
+            dict.TryAdd(name, id);
+        }
+        return dict.ToFrozenDictionary();
+    }
+
     public static List<Server> GetAllServers()
     {
         return _servers.Select(s => new Server { Id = s.Id, Name = s.Name }).ToList();
@@ -59,6 +75,11 @@ public class Server
         return ServerNames.TryGetValue(serverId, out var name) ? name : "Unknown";
     }
 
+    public static bool TryGetServerIdByName(string name, out int serverId)
+    {
+        return _idByName.TryGetValue(name, out serverId);
+    }
+
     public static int MapGnjoyServerId(int gnjoyId)
     {
         return _gnjoyToApiMap.TryGetValue(gnjoyId, out var apiId) ? apiId : gnjoyId;
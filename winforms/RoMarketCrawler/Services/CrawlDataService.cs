@@ -1,5 +1,6 @@
 using System.Diagnostics;
 using System.Text.Json;
+using System.Text.Json.Serialization;
 using RoMarketCrawler.Helpers;
 using RoMarketCrawler.Models;
 
@@ -11,16 +12,20 @@ namespace RoMarketCrawler.Services;
 public class CrawlDataService
 {
     private readonly string _crawlDir;
+    // Serializes detail cache file access; merges may run off the UI thread
+    private readonly object _detailCacheLock = new();
     private static readonly JsonSerializerOptions _jsonOptions = new()
     {
         WriteIndented = true,
         PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
-        Encoder = System.Text.Encodings.Web.JavaScriptEncoder.UnsafeRelaxedJsonEscaping
+        Encoder = System.Text.Encodings.Web.JavaScriptEncoder.UnsafeRelaxedJsonEscaping,
+        TypeInfoResolver = CrawlDataJsonContext.Default
     };
     private static readonly JsonSerializerOptions _jsonReadOptions = new()
     {
         PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
-        PropertyNameCaseInsensitive = true
+        PropertyNameCaseInsensitive = true,
+        TypeInfoResolver = CrawlDataJsonContext.Default
     };
 
     public CrawlDataService(string dataDir)
@@ -38,8 +43,8 @@ public class CrawlDataService
         var fileName = $"{SanitizeFileName(session.SearchTerm)}_{SanitizeFileName(session.ServerName)}.json";
         var filePath = Path.Combine(_crawlDir, fileName);
 
-        var json = JsonSerializer.Serialize(session, _jsonOptions);
-        await File.WriteAllTextAsync(filePath, json);
+        var json = JsonSerializer.SerializeToUtf8Bytes(session, _jsonOptions);
+        await File.WriteAllBytesAsync(filePath, json);
         Debug.WriteLine($"[CrawlDataService] Saved {session.Items.Count} items to {fileName}");
     }
 
@@ -79,8 +84,8 @@ public class CrawlDataService
         try
         {
             if (!File.Exists(filePath)) return null;
-            var json = await File.ReadAllTextAsync(filePath);
-            return JsonSerializer.Deserialize<CrawlSession>(json, _jsonReadOptions);
+            await using var stream = File.OpenRead(filePath);
+            return await JsonSerializer.DeserializeAsync<CrawlSession>(stream, _jsonReadOptions);
         }
         catch (Exception ex)
         {
@@ -155,17 +160,19 @@ public class CrawlDataService
         // Filter by item name (supports % wildcard)
         if (!string.IsNullOrWhiteSpace(filter.ItemName))
         {
+            var nameParts = SearchHelper.SplitWildcard(filter.ItemName);
             results = results.Where(item =>
-                SearchHelper.WildcardContains(item.ItemName, filter.ItemName) ||
-                SearchHelper.WildcardContains(item.DisplayName, filter.ItemName));
+                SearchHelper.WildcardContains(item.ItemName, nameParts) ||
+                SearchHelper.WildcardContains(item.DisplayName, nameParts));
         }
 
         // Filter by card/enchant (search in SlotInfo and RandomOptions, supports % wildcard)
         if (!string.IsNullOrWhiteSpace(filter.CardEnchant))
         {
+            var enchantParts = SearchHelper.SplitWildcard(filter.CardEnchant);
             results = results.Where(item =>
-                item.SlotInfo?.Any(s => SearchHelper.WildcardContains(s, filter.CardEnchant)) == true ||
-                item.RandomOptions?.Any(s => SearchHelper.WildcardContains(s, filter.CardEnchant)) == true);
+                item.SlotInfo?.Any(s => SearchHelper.WildcardContains(s, enchantParts)) == true ||
+                item.RandomOptions?.Any(s => SearchHelper.WildcardContains(s, enchantParts)) == true);
         }
 
         // Filter by price range
@@ -211,11 +218,13 @@ public class CrawlDataService
         try
         {
             var filePath = GetDetailCachePath(serverId);
-            if (!File.Exists(filePath)) return new();
-
-            var json = File.ReadAllText(filePath);
-            return JsonSerializer.Deserialize<Dictionary<string, ItemDetailInfo>>(json, _jsonReadOptions)
-                ?? new();
+            lock (_detailCacheLock)
+            {
+                if (!File.Exists(filePath)) return new();
+                using var stream = File.OpenRead(filePath);
+                return JsonSerializer.Deserialize<Dictionary<string, ItemDetailInfo>>(stream, _jsonReadOptions)
+                    ?? new();
+            }
         }
         catch (Exception ex)
         {
@@ -257,8 +266,11 @@ public class CrawlDataService
                 .ToDictionary(kvp => kvp.Key, kvp => kvp.Value);
 
             var filePath = GetDetailCachePath(serverId);
-            var json = JsonSerializer.Serialize(toSave, _jsonOptions);
-            File.WriteAllText(filePath, json);
+            var json = JsonSerializer.SerializeToUtf8Bytes(toSave, _jsonOptions);
+            lock (_detailCacheLock)
+            {
+                File.WriteAllBytes(filePath, json);
+            }
             Debug.WriteLine($"[CrawlDataService] Saved detail cache: {toSave.Count} entries for server {serverId}");
         }
         catch (Exception ex)
@@ -267,6 +279,29 @@ public class CrawlDataService
         }
     }
 
+    /// <summary>
+    /// Merge entries into the on-disk detail cache for a server.
+    /// Re-reads the file under the lock so entries saved by other tabs in the meantime are preserved.
+    /// Safe to call from a background thread.
+    /// </summary>
+    public void MergeDetailCache(int serverId, Dictionary<string, ItemDetailInfo> entries)
+    {
+        try
+        {
+            lock (_detailCacheLock)
+            {
+                var freshCache = LoadDetailCache(serverId);
+                foreach (var kvp in entries)
+                    freshCache[kvp.Key] = kvp.Value;
+                SaveDetailCache(serverId, freshCache);
+            }
+        }
+        catch (Exception ex)
+        {
+            Debug.WriteLine($"[CrawlDataService] Failed to merge detail cache: {ex.Message}");
+        }
+    }
+
     private string GetDetailCachePath(int serverId)
         => Path.Combine(_crawlDir, $"detail_cache_{serverId}.json");
 
@@ -314,6 +349,13 @@ public class CrawlDataService
         {
             // Quick read just the totalItems field without deserializing entire file
             using var stream = File.OpenRead(filePath);
+            if (TryReadTotalItemsFromHeader(stream, out var totalItems))
+            {
+                return totalItems;
+            }
+
+            // Field not in the header (e.g. different property order) - parse the whole document
+            stream.Position = 0;
             using var doc = JsonDocument.Parse(stream);
             if (doc.RootElement.TryGetProperty("totalItems", out var prop))
             {
@@ -323,4 +365,51 @@ public class CrawlDataService
         catch { }
         return 0;
     }
+
+    /// <summary>
+    /// Scan the first few KB of a session file for the top-level totalItems field.
+    /// SaveAsync writes it ahead of the items array, so the rest of the file never has to be read.
+    /// </summary>
+    private static bool TryReadTotalItemsFromHeader(Stream stream, out int totalItems)
+    {
+        totalItems = 0;
+        var buffer = new byte[4096];
+        var length = stream.ReadAtLeast(buffer, buffer.Length, throwOnEndOfStream: false);
+
+        try
+        {
+            var reader = new Utf8JsonReader(buffer.AsSpan(0, length), isFinalBlock: length < buffer.Length, state: default);
+            while (reader.Read())
+            {
+                if (reader.CurrentDepth != 1 || reader.TokenType != JsonTokenType.PropertyName)
+                    continue;
+
+                if (reader.ValueTextEquals("totalItems"))
+                {
+                    return reader.Read() && reader.TokenType == JsonTokenType.Number && reader.TryGetInt32(out totalItems);
+                }
+
+                // Everything after the items array is out of reach of the header buffer
+                if (reader.ValueTextEquals("items"))
+                    return false;
+            }
+        }
+        catch (JsonException)
+        {
+            // Malformed header; caller falls back to a full parse
+        }
+
+        return false;
+    }
+}
+
+/// <summary>
+/// Compile-time JSON metadata for the session and detail cache files, so the DealItem list
+/// is (de)serialized through generated accessors instead of reflection-built converters.
+/// Naming and escaping still come from the CrawlDataService options.
+/// </summary>
+[JsonSerializable(typeof(CrawlSession))]
+[JsonSerializable(typeof(Dictionary<string, ItemDetailInfo>))]
+internal partial class CrawlDataJsonContext : JsonSerializerContext
+{
 }
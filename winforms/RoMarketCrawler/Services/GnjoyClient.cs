@@ -125,7 +125,11 @@ public class GnjoyClient : IGnjoyClient
 
         _client = new HttpClient(_handler)
         {
-            Timeout = TimeSpan.FromSeconds(30)
+            Timeout = TimeSpan.FromSeconds(30),
+            // Prefer HTTP/2 so concurrent tab/monitor requests multiplex over one TLS connection
+            // instead of each opening its own; falls back to HTTP/1.1 if ALPN doesn't offer h2
+            DefaultRequestVersion = HttpVersion.Version20,
+            DefaultVersionPolicy = HttpVersionPolicy.RequestVersionOrLower
         };
 
         // Browser-like headers to avoid Cloudflare detection
@@ -155,7 +159,7 @@ public class GnjoyClient : IGnjoyClient
         _quoteParser = new PriceQuoteParser();
         _detailParser = new ItemDetailParser();
 
-        Debug.WriteLine("[GnjoyClient] Initialized with SocketsHttpHandler - MaxConnectionsPerServer=10, PooledConnectionLifetime=2min");
+        Debug.WriteLine("[GnjoyClient] Initialized with SocketsHttpHandler - HTTP/2 preferred, MaxConnectionsPerServer=10, PooledConnectionLifetime=2min");
     }
 
     /// <summary>
@@ -10,6 +10,33 @@ namespace RoMarketCrawler.Services;
 /// </summary>
 public class ItemDealParser
 {
+    #region Regex Patterns
+
+    // Total count ("검색결과 : 2,161건"), with a looser fallback for other tag layouts
+    private static readonly Regex TotalCountPattern = new(@"검색결과\s*:\s*(?:<[^>]+>\s*)*([\d,]+)\s*건", RegexOptions.Compiled);
+    private static readonly Regex TotalCountFallbackPattern = new(@"검색결과[^<]*?(?:<[^>]*>)*\s*([\d,]+)\s*(?:<[^>]*>)*\s*건", RegexOptions.Compiled);
+
+    // Grade markers ([UNIQUE], [RARE], ...); the trailing \s* lets the same pattern strip them
+    private static readonly Regex GradePattern = new(@"\[(UNIQUE|RARE|EPIC|LEGEND|MYTHIC|MAGIC)\]\s*", RegexOptions.Compiled | RegexOptions.IgnoreCase);
+
+    // onclick="CallItemDealView(svrID,mapID,'ssi',page)"
+    private static readonly Regex DealViewPattern = new(@"CallItemDealView\((\d+),(\d+),'([^']+)',(\d+)\)", RegexOptions.Compiled);
+    private static readonly Regex DealViewItemIdPattern = new(@"CallItemDealView\(\d+,(\d+),", RegexOptions.Compiled);
+
+    // RO inline tags: <NAVI>[NPC]<INFO>map,x,y,...</INFO></NAVI>
+    private static readonly Regex InfoTagPattern = new(@"<INFO>[^<]*</INFO>", RegexOptions.Compiled | RegexOptions.IgnoreCase);
+    private static readonly Regex InlineTagPattern = new(@"</?[A-Z_]+>", RegexOptions.Compiled | RegexOptions.IgnoreCase);
+
+    // Item name parts
+    private static readonly Regex RefinePattern = new(@"\+(\d+)(?=\s|\[|$|[가-힣])", RegexOptions.Compiled);
+    // Every "[..." marker, plus the whitespace after one that ends the name
+    private static readonly Regex TruncationPattern = new(@"\[\.\.\.(?:\s*$)?", RegexOptions.Compiled);
+    private static readonly Regex CardSlotsPattern = new(@"\[(\d+)\]$", RegexOptions.Compiled);
+
+    private static readonly Regex DigitsPattern = new(@"\d+", RegexOptions.Compiled);
+
+    #endregion
+
     /// <summary>
     /// Parse deal list and return result with total count
     /// </summary>
@@ -32,7 +59,7 @@ public class ItemDealParser
         {
             // Pattern: "검색결과 : 2,161건" - handles HTML tags like <b>, <strong> around the number
             // Examples: "검색결과 : 2,161건", "검색결과 : <b>2,161건</b>", "검색결과: <strong>2,161</strong>건"
-            var match = Regex.Match(html, @"검색결과\s*:\s*(?:<[^>]+>\s*)*([\d,]+)\s*건");
+            var match = TotalCountPattern.Match(html);
             if (match.Success)
             {
                 var countStr = match.Groups[1].Value.Replace(",", "");
@@ -44,7 +71,7 @@ public class ItemDealParser
             }
 
             // Fallback: Try to find any pattern with numbers followed by 건
-            match = Regex.Match(html, @"검색결과[^<]*?(?:<[^>]*>)*\s*([\d,]+)\s*(?:<[^>]*>)*\s*건");
+            match = TotalCountFallbackPattern.Match(html);
             if (match.Success)
             {
                 var countStr = match.Groups[1].Value.Replace(",", "");
@@ -74,15 +101,7 @@ public class ItemDealParser
             doc.LoadHtml(html);
 
             // Find the deal table
-            var table = doc.DocumentNode.SelectSingleNode("//table[contains(@class,'dealList')]");
-            if (table == null)
-            {
-                table = doc.DocumentNode.SelectSingleNode("//table[contains(@class,'tbl_deal')]");
-            }
-            if (table == null)
-            {
-                table = doc.DocumentNode.SelectSingleNode("//table[@id='dealList']");
-            }
+            var table = FindDealTable(doc);
             if (table == null)
             {
                 // Try to find any table with deal-related headers
@@ -110,8 +129,8 @@ public class ItemDealParser
             Debug.WriteLine($"[ItemDealParser] Table found: {table.GetAttributeValue("class", "no-class")}");
 
             // Parse table rows
-            var rows = table.SelectNodes(".//tr");
-            if (rows == null || rows.Count < 2)
+            var rows = table.Descendants("tr").ToList();
+            if (rows.Count < 2)
             {
                 Debug.WriteLine($"[ItemDealParser] No rows found or only header row");
                 return items;
@@ -119,18 +138,21 @@ public class ItemDealParser
 
             Debug.WriteLine($"[ItemDealParser] Found {rows.Count} rows (including header)");
 
+            // One timestamp for the whole page: every row was crawled by the same request
+            var crawledAt = DateTime.Now;
+
             // Skip header row
             foreach (var row in rows.Skip(1))
             {
-                var cells = row.SelectNodes(".//td");
-                if (cells == null || cells.Count < 5)
+                var cells = row.Descendants("td").ToList();
+                if (cells.Count < 5)
                 {
                     continue;
                 }
 
                 try
                 {
-                    var item = ParseRow(cells, defaultServerId);
+                    var item = ParseRow(cells, defaultServerId, crawledAt);
                     if (item != null)
                     {
                         items.Add(item);
@@ -151,7 +173,31 @@ public class ItemDealParser
         return items;
     }
 
-    private DealItem? ParseRow(HtmlNodeCollection cells, int defaultServerId)
+    /// <summary>
+    /// Find the deal table in one walk over the document's tables instead of one full XPath scan
+    /// per candidate selector. Priority is unchanged: class dealList, class tbl_deal, then id dealList.
+    /// </summary>
+    private static HtmlNode? FindDealTable(HtmlAgilityPack.HtmlDocument doc)
+    {
+        HtmlNode? byTblDealClass = null;
+        HtmlNode? byDealListId = null;
+
+        foreach (var table in doc.DocumentNode.Descendants("table"))
+        {
+            var cssClass = table.GetAttributeValue("class", string.Empty);
+            if (cssClass.Contains("dealList", StringComparison.Ordinal))
+                return table;
+
+            if (byTblDealClass == null && cssClass.Contains("tbl_deal", StringComparison.Ordinal))
+                byTblDealClass = table;
+            if (byDealListId == null && table.Id == "dealList")
+                byDealListId = table;
+        }
+
+        return byTblDealClass ?? byDealListId;
+    }
+
+    private DealItem? ParseRow(List<HtmlNode> cells, int defaultServerId, DateTime crawledAt)
     {
         try
         {
@@ -165,7 +211,7 @@ public class ItemDealParser
 
             // Get item name from img alt attribute
             string? fullItemNameFromAlt = null;
-            var img = itemCell.SelectSingleNode(".//img[@alt]");
+            var img = itemCell.Descendants("img").FirstOrDefault(n => n.Attributes.Contains("alt"));
             if (img != null)
             {
                 fullItemNameFromAlt = img.GetAttributeValue("alt", "");
@@ -182,16 +228,17 @@ public class ItemDealParser
             Debug.WriteLine($"[ItemDealParser] Grade extraction - cellText: '{cellText}', altText: '{altText}'");
 
             // Try cellText first (more likely to have grade info)
-            var gradeMatch = Regex.Match(cellText, @"\[(UNIQUE|RARE|EPIC|LEGEND|MYTHIC|MAGIC)\]", RegexOptions.IgnoreCase);
+            // A grade marker needs a '[', so skip the regex on text without one (most rows)
+            var gradeMatch = cellText.Contains('[') ? GradePattern.Match(cellText) : Match.Empty;
             if (gradeMatch.Success)
             {
                 grade = gradeMatch.Groups[1].Value.ToUpper();
                 Debug.WriteLine($"[ItemDealParser] Grade found in cellText: '{grade}'");
             }
-            else if (!string.IsNullOrEmpty(altText))
+            else if (altText.Contains('['))
             {
                 // Try altText if cellText didn't have grade
-                gradeMatch = Regex.Match(altText, @"\[(UNIQUE|RARE|EPIC|LEGEND|MYTHIC|MAGIC)\]", RegexOptions.IgnoreCase);
+                gradeMatch = GradePattern.Match(altText);
                 if (gradeMatch.Success)
                 {
                     grade = gradeMatch.Groups[1].Value.ToUpper();
@@ -199,7 +246,7 @@ public class ItemDealParser
                 }
             }
 
-            var (itemName, refine, cardSlots) = ParseItemName(itemCell, fullItemNameFromAlt);
+            var (itemName, refine, cardSlots) = ParseItemName(cellText, altText);
 
             // Extract item_id, mapId, ssi and image URL from onclick
             int? itemId = null;
@@ -209,16 +256,16 @@ public class ItemDealParser
 
             // Find onclick with CallItemDealView(svrID, mapID, 'ssi', page)
             // Example: onclick="javascript:CallItemDealView(129,2023,'7579659357999176565',1)"
-            var link = itemCell.SelectSingleNode(".//a[@onclick]");
+            var link = itemCell.Descendants("a").FirstOrDefault(n => n.Attributes.Contains("onclick"));
             if (link != null)
             {
                 var onclick = link.GetAttributeValue("onclick", "");
                 // Pattern: CallItemDealView(129,2023,'7579659357999176565',1)
-                var dealViewMatch = Regex.Match(onclick, @"CallItemDealView\((\d+),(\d+),'([^']+)',(\d+)\)");
-                if (dealViewMatch.Success)
+                var dealViewMatch = DealViewPattern.Match(onclick);
+                if (dealViewMatch.Success && int.TryParse(dealViewMatch.Groups[2].Value, out var parsedMapId))
                 {
                     // svrID is already parsed from cell[0]
-                    mapId = int.Parse(dealViewMatch.Groups[2].Value);
+                    mapId = parsedMapId;
                     ssi = dealViewMatch.Groups[3].Value;
                     Debug.WriteLine($"[ItemDealParser] Parsed CallItemDealView: mapId={mapId}, ssi={ssi}");
                 }
@@ -226,10 +273,10 @@ public class ItemDealParser
                 // Fallback: old pattern for item_id (if CallItemDealView pattern doesn't match)
                 if (!mapId.HasValue)
                 {
-                    var idMatch = Regex.Match(onclick, @"CallItemDealView\(\d+,(\d+),");
-                    if (idMatch.Success)
+                    var idMatch = DealViewItemIdPattern.Match(onclick);
+                    if (idMatch.Success && int.TryParse(idMatch.Groups[1].Value, out var parsedItemId))
                     {
-                        itemId = int.Parse(idMatch.Groups[1].Value);
+                        itemId = parsedItemId;
                     }
                 }
             }
@@ -257,11 +304,7 @@ public class ItemDealParser
 
             // Shop name and deal type (column 4)
             var shopCell = cells[4];
-            var shopName = Regex.Replace(
-                Regex.Replace(
-                    System.Net.WebUtility.HtmlDecode(shopCell.InnerText.Trim()),
-                    @"<INFO>[^<]*</INFO>", "", RegexOptions.IgnoreCase),
-                @"</?[A-Z_]+>", "", RegexOptions.IgnoreCase);
+            var shopName = StripInlineTags(System.Net.WebUtility.HtmlDecode(shopCell.InnerText.Trim()));
             string? dealType = null;
             var shopClass = shopCell.GetAttributeValue("class", "");
             Debug.WriteLine($"[ItemDealParser] Shop cell class: '{shopClass}'");
@@ -301,9 +344,11 @@ public class ItemDealParser
                 MapName = mapName,
                 MapId = mapId,
                 Ssi = ssi,
-                CrawledAt = DateTime.Now,
+                CrawledAt = crawledAt,
             };
 
+            // Every DealItem is built here, so display fields are computed exactly once on the way out;
+            // callers only need ComputeFields after changing Price or naming fields themselves
             item.ComputeFields();
             return item;
         }
@@ -318,6 +363,12 @@ public class ItemDealParser
     {
         text = text.Trim();
 
+        // Exact name is the common case; fall back to the substring scan for decorated text
+        if (Server.TryGetServerIdByName(text, out var exactId))
+        {
+            return exactId;
+        }
+
         foreach (var kvp in Server.ServerNames)
         {
             if (kvp.Value.Contains(text) || text.Contains(kvp.Value))
@@ -327,21 +378,22 @@ public class ItemDealParser
         }
 
         // Try numeric match
-        var match = Regex.Match(text, @"\d+");
-        if (match.Success)
+        var match = DigitsPattern.Match(text);
+        if (match.Success && int.TryParse(match.Value, out var serverId))
         {
-            return int.Parse(match.Value);
+            return serverId;
         }
 
         return defaultId;
     }
 
-    private (string itemName, int? refine, string? cardSlots) ParseItemName(HtmlNode cell, string? fullItemNameFromAlt = null)
+    /// <summary>
+    /// Parse name, refine and card slots from the item cell.
+    /// Takes the trimmed cell text and img alt text already read by ParseRow, since
+    /// HtmlNode.InnerText rebuilds the text from the subtree on every access.
+    /// </summary>
+    private (string itemName, int? refine, string? cardSlots) ParseItemName(string cellText, string altText)
     {
-        // Get both sources
-        var cellText = cell.InnerText.Trim();
-        var altText = fullItemNameFromAlt?.Trim() ?? "";
-
         Debug.WriteLine($"[ItemDealParser] cellText: '{cellText}', altText: '{altText}'");
 
         // Choose the item name source
@@ -440,54 +492,74 @@ public class ItemDealParser
 
         Debug.WriteLine($"[ItemDealParser] ParseItemName input: '{text}'");
 
+        // Each pass below checks for its marker character first and only runs its regex
+        // when it's present, since most names have no refine, slots, grade or tags
+
         // Extract refine level (+1 ~ +20)
         // Note: "딤" means "dimension" and is part of item name (e.g., "12딤 글레이시아 스피어")
         // Pattern: +숫자 followed by space, [, end-of-string, OR Korean characters
         // Korean chars are allowed because items like "+11장교의 모자" have Korean directly after refine
         // The + prefix distinguishes refine from dimension numbers like "12딤"
         int? refine = null;
-        var refineMatch = Regex.Match(text, @"\+(\d+)(?=\s|\[|$|[가-힣])");
-        if (refineMatch.Success)
+        var refineMatch = text.Contains('+') ? RefinePattern.Match(text) : Match.Empty;
+        if (refineMatch.Success && int.TryParse(refineMatch.Groups[1].Value, out var refineValue))
         {
-            refine = int.Parse(refineMatch.Groups[1].Value);
+            refine = refineValue;
             // Remove only the +숫자 part, preserve text that follows (like "딤")
             text = text.Remove(refineMatch.Index, refineMatch.Length);
             Debug.WriteLine($"[ItemDealParser] After refine removal: '{text}', refine={refine}");
         }
 
-        // Remove truncation marker [...  or [... at end (GNJOY truncates long item names)
-        text = Regex.Replace(text, @"\[\.\.\.$", "");
-        text = Regex.Replace(text, @"\[\.\.\.\s*$", "");
+        // Remove truncation markers: [...  or [... at end (GNJOY truncates long item names),
+        // and any stray marker elsewhere, in one pass before the card slot check
+        if (text.Contains("[..."))
+            text = TruncationPattern.Replace(text, "");
 
         // Extract card slots - only numeric [N] patterns at the end
         string? cardSlots = null;
-        var cardMatch = Regex.Match(text, @"\[(\d+)\]$");
+        var cardMatch = text.EndsWith(']') ? CardSlotsPattern.Match(text) : Match.Empty;
         if (cardMatch.Success)
         {
             cardSlots = cardMatch.Groups[1].Value;
-            text = Regex.Replace(text, @"\[\d+\]$", "");
+            text = text.Remove(cardMatch.Index, cardMatch.Length);
             Debug.WriteLine($"[ItemDealParser] After card slots removal: '{text}', cardSlots={cardSlots}");
         }
 
         // Remove grade markers like [UNIQUE], [RARE] etc. (these are handled separately)
-        text = Regex.Replace(text, @"\[(UNIQUE|RARE|EPIC|LEGEND|MYTHIC|MAGIC)\]\s*", "", RegexOptions.IgnoreCase);
+        if (text.Contains('['))
+            text = GradePattern.Replace(text, "");
 
-        // Final cleanup: remove any remaining truncation markers
-        text = Regex.Replace(text, @"\[\.\.\.", "");
-
-        // Strip RO inline tags: <NAVI>[NPC]<INFO>map,x,y,...</INFO></NAVI>
-        text = Regex.Replace(text, @"<INFO>[^<]*</INFO>", "", RegexOptions.IgnoreCase);
-        text = Regex.Replace(text, @"</?[A-Z_]+>", "", RegexOptions.IgnoreCase);
+        text = StripInlineTags(text);
 
         var result = System.Net.WebUtility.HtmlDecode(text.Trim());
         Debug.WriteLine($"[ItemDealParser] ParseItemName result: '{result}'");
         return (result, refine, cardSlots);
     }
 
+    /// <summary>
+    /// Strip RO inline tags: &lt;NAVI&gt;[NPC]&lt;INFO&gt;map,x,y,...&lt;/INFO&gt;&lt;/NAVI&gt;
+    /// </summary>
+    private static string StripInlineTags(string text)
+    {
+        if (!text.Contains('<'))
+            return text;
+
+        text = InfoTagPattern.Replace(text, "");
+        return InlineTagPattern.Replace(text, "");
+    }
+
     private int ParseNumber(string text)
     {
-        // Remove commas, 'z' (zeny), and other non-numeric chars
-        var clean = Regex.Replace(text, @"[^\d]", "");
-        return string.IsNullOrEmpty(clean) ? 0 : int.TryParse(clean, out var result) ? result : 0;
+        // Skip commas, 'z' (zeny), and other non-numeric chars while accumulating the digits
+        // (no intermediate string; out-of-range values still yield 0 like the old int.TryParse)
+        long value = 0;
+        foreach (var c in text)
+        {
+            if (!char.IsAsciiDigit(c)) continue;
+
+            value = value * 10 + (c - '0');
+            if (value > int.MaxValue) return 0;
+        }
+        return (int)value;
     }
 }
@@ -1,4 +1,5 @@
 using System.Diagnostics;
+using System.Text.Json.Serialization;
 using System.Text.RegularExpressions;
 using HtmlAgilityPack;
 
@@ -370,7 +371,10 @@ public class ItemDetailParser
 /// </summary>
 public class ItemDetailInfo
 {
+    // Populate: loading the detail cache fills these lists instead of allocating a replacement per entry
+    [JsonObjectCreationHandling(JsonObjectCreationHandling.Populate)]
     public List<string> SlotInfo { get; set; } = new();
+    [JsonObjectCreationHandling(JsonObjectCreationHandling.Populate)]
     public List<string> RandomOptions { get; set; } = new();
     public string? Element { get; set; }
     public string? Maker { get; set; }
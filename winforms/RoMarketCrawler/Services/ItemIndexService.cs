@@ -17,10 +17,26 @@ public class ItemIndexService : IItemIndexService
     private const int ItemsPerPage = 50;
     private const int MaxPagesPerCategory = 500; // Safety limit (50*500=25000 items max)
 
+    private static readonly JsonSerializerOptions _jsonReadOptions = new()
+    {
+        PropertyNameCaseInsensitive = true
+    };
+    private static readonly JsonSerializerOptions _jsonWriteOptions = new()
+    {
+        WriteIndented = false, // Compact for smaller file size
+        Encoder = System.Text.Encodings.Web.JavaScriptEncoder.UnsafeRelaxedJsonEscaping
+    };
+
     // In-memory index
     private Dictionary<int, KafraItemDto> _itemsById = new();
     private Dictionary<string, int> _idByScreenName = new(StringComparer.OrdinalIgnoreCase);
-    private HashSet<int> _canonicalIds = new();
+    // Canonical items (duplicates removed) in index order, plus the same items bucketed by type.
+    // Searches walk these instead of re-checking every item against a canonical set and type filter.
+    private List<KafraItemDto> _canonicalItems = new();
+    private Dictionary<int, List<KafraItemDto>> _canonicalItemsByType = new();
+    // Case-folded character bigram -> ascending positions in _canonicalItems whose ScreenName/Name
+    // contain it. Name searches intersect these lists instead of running Contains over every item.
+    private Dictionary<int, List<int>> _nameBigramIndex = new();
     private ItemIndexMetadata _metadata = new();
     private readonly object _indexLock = new();
 
@@ -67,11 +83,11 @@ public class ItemIndexService : IItemIndexService
 
         try
         {
-            var json = await File.ReadAllTextAsync(_cacheFilePath);
-            var indexFile = JsonSerializer.Deserialize<ItemIndexFile>(json, new JsonSerializerOptions
+            ItemIndexFile? indexFile;
+            await using (var stream = File.OpenRead(_cacheFilePath))
             {
-                PropertyNameCaseInsensitive = true
-            });
+                indexFile = await JsonSerializer.DeserializeAsync<ItemIndexFile>(stream, _jsonReadOptions);
+            }
 
             if (indexFile == null || !indexFile.Metadata.Validate())
             {
@@ -283,7 +299,6 @@ public class ItemIndexService : IItemIndexService
         if (string.IsNullOrWhiteSpace(searchTerm)) return new List<KafraItemDto>();
 
         var results = new List<KafraItemDto>();
-        var searchLower = searchTerm.ToLowerInvariant();
 
         lock (_indexLock)
         {
@@ -325,19 +340,14 @@ public class ItemIndexService : IItemIndexService
     public int CountItems(string searchTerm, HashSet<int> itemTypes, bool searchDescription = false)
     {
         var hasSearchTerm = !string.IsNullOrWhiteSpace(searchTerm);
-        var allTypes = itemTypes.Contains(999);
         var count = 0;
 
         lock (_indexLock)
         {
-            foreach (var item in _itemsById.Values)
+            foreach (var item in GetCanonicalCandidates(searchTerm, searchDescription, itemTypes, out var filterByType))
             {
-                // Skip duplicate items (same ScreenName, keep lowest ID only)
-                if (!_canonicalIds.Contains(item.Id))
-                    continue;
-
-                // Type filter (999 = all types)
-                if (!allTypes && !itemTypes.Contains(item.Type))
+                // Type filter (999 = all types; skipped when GetCanonicalCandidates already narrowed by type)
+                if (filterByType && !itemTypes.Contains(item.Type))
                     continue;
 
                 // Name filter (if search term provided)
@@ -377,21 +387,16 @@ public class ItemIndexService : IItemIndexService
     {
         var results = new List<KafraItem>();
         var hasSearchTerm = !string.IsNullOrWhiteSpace(searchTerm);
-        var allTypes = itemTypes.Contains(999);
         var skipped = 0;
 
         lock (_indexLock)
         {
-            foreach (var item in _itemsById.Values)
+            foreach (var item in GetCanonicalCandidates(searchTerm, searchDescription, itemTypes, out var filterByType))
             {
                 if (results.Count >= take) break;
 
-                // Skip duplicate items (same ScreenName, keep lowest ID only)
-                if (!_canonicalIds.Contains(item.Id))
-                    continue;
-
-                // Type filter (999 = all types)
-                if (!allTypes && !itemTypes.Contains(item.Type))
+                // Type filter (999 = all types; skipped when GetCanonicalCandidates already narrowed by type)
+                if (filterByType && !itemTypes.Contains(item.Type))
                     continue;
 
                 // Name filter (if search term provided)
@@ -425,7 +430,124 @@ public class ItemIndexService : IItemIndexService
     }
 
     /// <summary>
-    /// Build canonical ID set: for each ScreenName, keep only the lowest ID (newest version).
+    /// Pick the canonical items to scan for a search, in index order.
+    /// Name-only searches of 2+ chars use the bigram index; otherwise a single type uses its bucket,
+    /// 999 (all) uses the full list, and other multi-type selections scan the full list.
+    /// Callers still verify the name match and apply the type filter when <paramref name="filterByType"/> is set.
+    /// Must be called inside _indexLock.
+    /// </summary>
+    private List<KafraItemDto> GetCanonicalCandidates(
+        string searchTerm, bool searchDescription, HashSet<int> itemTypes, out bool filterByType)
+    {
+        // Description matches can't be answered from the name index
+        if (!searchDescription && !string.IsNullOrWhiteSpace(searchTerm) && searchTerm.Length >= 2)
+        {
+            filterByType = !itemTypes.Contains(999);
+            var positions = FindNameCandidates(searchTerm);
+            var candidates = new List<KafraItemDto>(positions.Count);
+            foreach (var position in positions)
+                candidates.Add(_canonicalItems[position]);
+            return candidates;
+        }
+
+        filterByType = false;
+        if (itemTypes.Contains(999))
+            return _canonicalItems;
+
+        if (itemTypes.Count == 1)
+        {
+            var type = itemTypes.First();
+            return _canonicalItemsByType.TryGetValue(type, out var bucket) ? bucket : new List<KafraItemDto>();
+        }
+
+        filterByType = true;
+        return _canonicalItems;
+    }
+
+    /// <summary>
+    /// Positions in _canonicalItems whose names contain every bigram of the term (a superset of the
+    /// real matches). Must be called inside _indexLock.
+    /// </summary>
+    private List<int> FindNameCandidates(string searchTerm)
+    {
+        var postings = new List<List<int>>();
+        var seen = new HashSet<int>();
+        for (int i = 0; i + 1 < searchTerm.Length; i++)
+        {
+            var key = NameBigramKey(searchTerm[i], searchTerm[i + 1]);
+            if (!seen.Add(key))
+                continue;
+            if (!_nameBigramIndex.TryGetValue(key, out var list))
+                return new List<int>();
+            postings.Add(list);
+        }
+
+        // Intersect from the rarest bigram so the working set shrinks as fast as possible
+        postings.Sort((a, b) => a.Count.CompareTo(b.Count));
+        var result = new List<int>(postings[0]);
+        for (int p = 1; p < postings.Count && result.Count > 0; p++)
+        {
+            var other = postings[p];
+            var merged = new List<int>(Math.Min(result.Count, other.Count));
+            if (other.Count > result.Count * 8)
+            {
+                // Common bigrams have very long lists; binary-search each surviving position
+                // within the unvisited tail instead of walking the whole list
+                int lo = 0;
+                foreach (var position in result)
+                {
+                    var idx = other.BinarySearch(lo, other.Count - lo, position, null);
+                    if (idx >= 0)
+                    {
+                        merged.Add(position);
+                        lo = idx + 1;
+                    }
+                    else
+                    {
+                        lo = ~idx;
+                    }
+                    if (lo >= other.Count) break;
+                }
+            }
+            else
+            {
+                int i = 0, j = 0;
+                while (i < result.Count && j < other.Count)
+                {
+                    if (result[i] == other[j]) { merged.Add(result[i]); i++; j++; }
+                    else if (result[i] < other[j]) i++;
+                    else j++;
+                }
+            }
+            result = merged;
+        }
+
+        return result;
+    }
+
+    private static void AddNameBigrams(Dictionary<int, List<int>> index, string? name, int position)
+    {
+        if (string.IsNullOrEmpty(name)) return;
+
+        for (int i = 0; i + 1 < name.Length; i++)
+        {
+            var key = NameBigramKey(name[i], name[i + 1]);
+            if (!index.TryGetValue(key, out var list))
+            {
+                list = new List<int>();
+                index[key] = list;
+            }
+            // Positions are added in ascending order, so a repeat is always the last entry
+            if (list.Count == 0 || list[^1] != position)
+                list.Add(position);
+        }
+    }
+
+    private static int NameBigramKey(char first, char second)
+        => (char.ToUpperInvariant(first) << 16) | char.ToUpperInvariant(second);
+
+    /// <summary>
+    /// Build canonical item lists: for each ScreenName, keep only the lowest ID (newest version).
     /// Must be called inside _indexLock.
     /// </summary>
     private void BuildCanonicalIds()
@@ -440,15 +562,36 @@ public class ItemIndexService : IItemIndexService
                 nameToLowestId[item.ScreenName] = item.Id;
         }
 
-        _canonicalIds = new HashSet<int>(nameToLowestId.Values);
+        var canonicalIds = new HashSet<int>(nameToLowestId.Values);
 
-        // Items without ScreenName are always canonical
+        var canonicalItems = new List<KafraItemDto>(canonicalIds.Count);
+        var canonicalItemsByType = new Dictionary<int, List<KafraItemDto>>();
+        var nameBigramIndex = new Dictionary<int, List<int>>();
         foreach (var item in _itemsById.Values)
         {
-            if (string.IsNullOrEmpty(item.ScreenName))
-                _canonicalIds.Add(item.Id);
+            // Items without ScreenName are always canonical
+            if (!string.IsNullOrEmpty(item.ScreenName) && !canonicalIds.Contains(item.Id))
+                continue;
+
+            AddNameBigrams(nameBigramIndex, item.ScreenName, canonicalItems.Count);
+            AddNameBigrams(nameBigramIndex, item.Name, canonicalItems.Count);
+            canonicalItems.Add(item);
+            if (!canonicalItemsByType.TryGetValue(item.Type, out var bucket))
+            {
+                bucket = new List<KafraItemDto>();
+                canonicalItemsByType[item.Type] = bucket;
+            }
+            bucket.Add(item);
         }
 
+        // Posting lists are read-only until the next rebuild; drop the growth slack
+        foreach (var list in nameBigramIndex.Values)
+            list.TrimExcess();
+
+        _canonicalItems = canonicalItems;
+        _canonicalItemsByType = canonicalItemsByType;
+        _nameBigramIndex = nameBigramIndex;
+
         // Update name lookup to point to canonical IDs
         _idByScreenName = nameToLowestId;
     }
@@ -515,35 +658,18 @@ public class ItemIndexService : IItemIndexService
             var url = $"{BaseUrl}/{itemType}/{page}/itemdetail_name.json?perPage={ItemsPerPage}";
 
             Debug.WriteLine($"[ItemIndexService] Fetching: {url}");
-            var response = await _httpClient.GetStringAsync(url);
-
-            var items = JsonSerializer.Deserialize<List<KafraItemRaw>>(response, new JsonSerializerOptions
-            {
-                PropertyNameCaseInsensitive = true
-            });
+            await using var stream = await _httpClient.GetStreamAsync(url);
+            var items = await JsonSerializer.DeserializeAsync<List<KafraItemRaw>>(stream, _jsonReadOptions);
 
             if (items == null) return null;
 
-            // Convert to DTO (handle nullable fields from API)
-            return items.Select(item =>
+            // Convert to DTO in a single pre-sized pass (no per-item delegate call or list regrowth)
+            var dtos = new List<KafraItemDto>(items.Count);
+            foreach (var item in items)
             {
-                var type = item.Type ?? 0;  // local name avoids shadowing the 'itemType' parameter
-                var itemText = NormalizeLineBreaks(item.ItemText);
-                return new KafraItemDto
-                {
-                    Id = item.ItemConst,
-                    Name = item.Name,
-                    ScreenName = item.ScreenName,
-                    Type = type,
-                    Slots = item.Slots ?? 0,
-                    Weight = item.Weight ?? 0,
-                    PriceBuy = item.PriceBuy,
-                    PriceSell = item.PriceSell,
-                    ItemText = itemText,
-                    EquipJobsText = item.EquipJobsText,
-                    Details = ItemTextParser.Parse(itemText, type)
-                };
-            }).ToList();
+                dtos.Add(ToDto(item));
+            }
+            return dtos;
         }
         catch (HttpRequestException ex)
         {
@@ -557,6 +683,29 @@ public class ItemIndexService : IItemIndexService
         }
     }
 
+    /// <summary>
+    /// Convert a raw API item to the index DTO (handles nullable fields from API)
+    /// </summary>
+    private static KafraItemDto ToDto(KafraItemRaw item)
+    {
+        var itemType = item.Type ?? 0;
+        var itemText = NormalizeLineBreaks(item.ItemText);
+        return new KafraItemDto
+        {
+            Id = item.ItemConst,
+            Name = item.Name,
+            ScreenName = item.ScreenName,
+            Type = itemType,
+            Slots = item.Slots ?? 0,
+            Weight = item.Weight ?? 0,
+            PriceBuy = item.PriceBuy,
+            PriceSell = item.PriceSell,
+            ItemText = itemText,
+            EquipJobsText = item.EquipJobsText,
+            Details = ItemTextParser.Parse(itemText, itemType)
+        };
+    }
+
     private async Task SaveToCacheAsync()
     {
         try
@@ -581,13 +730,9 @@ public class ItemIndexService : IItemIndexService
                 Items = stringKeyItems
             };
 
-            var json = JsonSerializer.Serialize(indexFile, new JsonSerializerOptions
-            {
-                WriteIndented = false, // Compact for smaller file size
-                Encoder = System.Text.Encodings.Web.JavaScriptEncoder.UnsafeRelaxedJsonEscaping
-            });
+            var json = JsonSerializer.SerializeToUtf8Bytes(indexFile, _jsonWriteOptions);
 
-            await File.WriteAllTextAsync(_cacheFilePath, json).ConfigureAwait(false);
+            await File.WriteAllBytesAsync(_cacheFilePath, json).ConfigureAwait(false);
             Debug.WriteLine($"[ItemIndexService] Saved cache: {_cacheFilePath}");
         }
         catch (Exception ex)
@@ -642,18 +787,27 @@ public class ItemIndexService : IItemIndexService
 
         var tasks = new List<Task>();
 
+        // Snapshot the already-indexed IDs in the range under one lock instead of taking the
+        // index lock once per ID below (scan tasks only ever add their own ID, so it stays valid)
+        var existingIds = new HashSet<int>();
+        lock (_indexLock)
+        {
+            for (int id = startId; id <= endId; id++)
+            {
+                if (_itemsById.ContainsKey(id))
+                    existingIds.Add(id);
+            }
+        }
+
         for (int id = startId; id <= endId; id++)
         {
             if (ct.IsCancellationRequested) break;
 
             // Skip if already in index
-            lock (_indexLock)
+            if (existingIds.Contains(id))
             {
-                if (_itemsById.ContainsKey(id))
-                {
-                    Interlocked.Increment(ref scannedCount);
-                    continue;
-                }
+                Interlocked.Increment(ref scannedCount);
+                continue;
             }
 
             var currentId = id;
@@ -713,6 +867,12 @@ public class ItemIndexService : IItemIndexService
         // Update metadata
         if (newItemsCount > 0)
         {
+            // Refresh canonical lists so newly scanned items are searchable
+            lock (_indexLock)
+            {
+                BuildCanonicalIds();
+            }
+
             _metadata.TotalCount = _itemsById.Count;
             _metadata.UpdatedAt = DateTime.UtcNow;
 
@@ -760,32 +920,12 @@ public class ItemIndexService : IItemIndexService
         try
         {
             var url = $"{BaseUrl}/{itemId}/item.json";
-            var response = await _httpClient.GetStringAsync(url);
-
-            var items = JsonSerializer.Deserialize<List<KafraItemRaw>>(response, new JsonSerializerOptions
-            {
-                PropertyNameCaseInsensitive = true
-            });
+            await using var stream = await _httpClient.GetStreamAsync(url);
+            var items = await JsonSerializer.DeserializeAsync<List<KafraItemRaw>>(stream, _jsonReadOptions);
 
             if (items != null && items.Count > 0)
             {
-                var item = items[0];
-                var itemType = item.Type ?? 0;
-                var itemText = NormalizeLineBreaks(item.ItemText);
-                return new KafraItemDto
-                {
-                    Id = item.ItemConst,
-                    Name = item.Name,
-                    ScreenName = item.ScreenName,
-                    Type = itemType,
-                    Slots = item.Slots ?? 0,
-                    Weight = item.Weight ?? 0,
-                    PriceBuy = item.PriceBuy,
-                    PriceSell = item.PriceSell,
-                    ItemText = itemText,
-                    EquipJobsText = item.EquipJobsText,
-                    Details = ItemTextParser.Parse(itemText, itemType)
-                };
+                return ToDto(items[0]);
             }
         }
         catch
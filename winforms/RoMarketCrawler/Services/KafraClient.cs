@@ -1,3 +1,5 @@
+using System.Collections.Concurrent;
+using System.Collections.Frozen;
 using System.Diagnostics;
 using System.Net.Http;
 using System.Text.Json;
@@ -20,10 +22,23 @@ namespace RoMarketCrawler.Services;
 public class KafraClient : IKafraClient
 {
     private readonly HttpClient _httpClient;
-    private readonly Dictionary<string, KafraItem> _cache = new();
-    private readonly object _cacheLock = new();
+    // Lock-free cache: lookups happen on every item info/effect request, and single-key
+    // reads/writes have no multi-step invariants that would require a lock
+    private readonly ConcurrentDictionary<string, KafraItem> _cache = new();
+    // Insertion order of cache keys, used to evict the oldest entries once MaxCacheSize is exceeded
+    private readonly ConcurrentQueue<string> _cacheOrder = new();
+    // Entry count kept alongside _cache; ConcurrentDictionary.Count takes every bucket lock
+    private int _cacheSize;
+    private const int MaxCacheSize = 4096;
+    // Collapses whitespace runs (including NBSP from HTML-decoded GNJOY names) in cache keys
+    private static readonly System.Text.RegularExpressions.Regex CacheKeyWhitespacePattern =
+        new(@"\s+", System.Text.RegularExpressions.RegexOptions.Compiled);
     private const string BaseUrl = "http://api.kafra.kr/KRO";
     private const int DefaultPerPage = 50;
+    private static readonly JsonSerializerOptions _jsonReadOptions = new()
+    {
+        PropertyNameCaseInsensitive = true
+    };
 
     // Input validation constants
     private const int MaxSearchTermLength = 100;
@@ -32,7 +47,8 @@ public class KafraClient : IKafraClient
 
     // GNJOY to kafra.kr card name mapping (different Korean transliterations)
     // GNJOY uses Japanese/German style, kafra.kr uses English style
-    private static readonly Dictionary<string, string> CardNameMapping = new(StringComparer.OrdinalIgnoreCase)
+    // Frozen: built once and never mutated, so lookups use a read-optimized table
+    private static readonly FrozenDictionary<string, string> CardNameMapping = new Dictionary<string, string>
     {
         // Monster cards with name differences
         { "미노타우르스", "마이너우로스" },       // Minorous
@@ -46,18 +62,18 @@ public class KafraClient : IKafraClient
         { "포이즌스포어", "포이즌 스포어" },     // Poison Spore
         { "골렘", "고렘" },                       // Golem
         // Add more mappings as discovered
-    };
+    }.ToFrozenDictionary(StringComparer.OrdinalIgnoreCase);
 
     // Card screen_name to kafra.kr ID mapping for cards with internal name "이름없는카드"
     // These cards can't be found by name search, only by direct ID lookup
-    private static readonly Dictionary<string, int> CardIdMapping = new(StringComparer.OrdinalIgnoreCase)
+    private static readonly FrozenDictionary<string, int> CardIdMapping = new Dictionary<string, int>
     {
         // MVP/Boss cards with "이름없는카드" internal name
         { "파라오 카드", 4148 },
         { "다크로드 카드", 4168 },
         { "봉인된 파라오 카드", 4489 },
         // Add more cards as discovered
-    };
+    }.ToFrozenDictionary(StringComparer.OrdinalIgnoreCase);
 
     public KafraClient()
     {
@@ -91,24 +107,15 @@ public class KafraClient : IKafraClient
             var url = $"{BaseUrl}/{itemType}/1/itemdetail_name.json?q={encodedQuery}&perPage={maxResults}";
 
             Debug.WriteLine($"[KafraClient] Searching: {url}");
-            var response = await _httpClient.GetStringAsync(url);
-            var items = JsonSerializer.Deserialize<List<KafraItem>>(response, new JsonSerializerOptions
-            {
-                PropertyNameCaseInsensitive = true
-            });
+            await using var stream = await _httpClient.GetStreamAsync(url);
+            var items = await JsonSerializer.DeserializeAsync<List<KafraItem>>(stream, _jsonReadOptions);
 
             if (items != null)
             {
                 // Cache results
-                lock (_cacheLock)
+                foreach (var item in items)
                 {
-                    foreach (var item in items)
-                    {
-                        if (!string.IsNullOrEmpty(item.ScreenName))
-                        {
-                            _cache[item.ScreenName] = item;
-                        }
-                    }
+                    AddToCache(item);
                 }
                 Debug.WriteLine($"[KafraClient] Found {items.Count} items for '{searchTerm}'");
                 return items;
@@ -133,11 +140,8 @@ public class KafraClient : IKafraClient
             var url = $"{BaseUrl}/{itemId}/item.json";
             Debug.WriteLine($"[KafraClient] GetItemById: {url}");
 
-            var response = await _httpClient.GetStringAsync(url);
-            var items = JsonSerializer.Deserialize<List<KafraItem>>(response, new JsonSerializerOptions
-            {
-                PropertyNameCaseInsensitive = true
-            });
+            await using var stream = await _httpClient.GetStreamAsync(url);
+            var items = await JsonSerializer.DeserializeAsync<List<KafraItem>>(stream, _jsonReadOptions);
 
             if (items != null && items.Count > 0)
             {
@@ -148,13 +152,7 @@ public class KafraClient : IKafraClient
                     item.ItemText = NormalizeLineBreaks(item.ItemText);
                 }
                 // Cache the result by screen_name
-                if (!string.IsNullOrEmpty(item.ScreenName))
-                {
-                    lock (_cacheLock)
-                    {
-                        _cache[item.ScreenName] = item;
-                    }
-                }
+                AddToCache(item);
                 Debug.WriteLine($"[KafkaClient] GetItemById found: {item.ScreenName}");
                 return item;
             }
@@ -177,12 +175,9 @@ public class KafraClient : IKafraClient
             return null;
 
         // Check cache first
-        lock (_cacheLock)
+        if (_cache.TryGetValue(NormalizeCacheKey(itemName), out var cachedItem))
         {
-            if (_cache.TryGetValue(itemName, out var cachedItem))
-            {
-                return NormalizeLineBreaks(cachedItem.ItemText);
-            }
+            return NormalizeLineBreaks(cachedItem.ItemText);
         }
 
         // Search API with original name
@@ -241,12 +236,9 @@ public class KafraClient : IKafraClient
             return null;
 
         // Check cache first
-        lock (_cacheLock)
+        if (_cache.TryGetValue(NormalizeCacheKey(itemName), out var cachedItem))
         {
-            if (_cache.TryGetValue(itemName, out var cachedItem))
-            {
-                return cachedItem;
-            }
+            return cachedItem;
         }
 
         // Step 1: Clean refine level prefix (+10, +12, etc.)
@@ -522,23 +514,57 @@ public class KafraClient : IKafraClient
         Debug.WriteLine($"[KafraClient] Preloaded {_cache.Count} items");
     }
 
-    public int CacheCount
+    public int CacheCount => Volatile.Read(ref _cacheSize);
+
+    public void ClearCache()
     {
-        get
+        _cache.Clear();
+        _cacheOrder.Clear();
+        Interlocked.Exchange(ref _cacheSize, 0);
+    }
+
+    /// <summary>
+    /// Add item to cache by screen_name, evicting the oldest entries beyond MaxCacheSize
+    /// </summary>
+    private void AddToCache(KafraItem item)
+    {
+        if (string.IsNullOrEmpty(item.ScreenName)) return;
+
+        var key = NormalizeCacheKey(item.ScreenName);
+
+        // Only a key that was actually absent is queued for eviction, even if it was evicted
+        // between our lookup and the write (the update factory resets the flag on a lost add race)
+        var added = false;
+        _cache.AddOrUpdate(key,
+            _ => { added = true; return item; },
+            (_, _) => { added = false; return item; });
+        if (!added) return;
+
+        _cacheOrder.Enqueue(key);
+        Interlocked.Increment(ref _cacheSize);
+        while (Volatile.Read(ref _cacheSize) > MaxCacheSize && _cacheOrder.TryDequeue(out var oldest))
         {
-            lock (_cacheLock)
-            {
-                return _cache.Count;
-            }
+            if (_cache.TryRemove(oldest, out _))
+                Interlocked.Decrement(ref _cacheSize);
         }
     }
 
-    public void ClearCache()
+    /// <summary>
+    /// Normalize an item name for use as a cache key.
+    /// Trims and collapses whitespace runs to a single space so names differing only in
+    /// spacing (e.g. NBSP from GNJOY HTML vs. typed spaces) share one cache entry.
+    /// </summary>
+    private static string NormalizeCacheKey(string name)
     {
-        lock (_cacheLock)
+        var trimmed = name.Trim();
+        // Fast path: most names contain only single ASCII spaces, so skip the regex for them
+        for (int i = 0; i < trimmed.Length; i++)
         {
-            _cache.Clear();
+            var c = trimmed[i];
+            if (char.IsWhiteSpace(c) && (c != ' ' || trimmed[i + 1] == ' '))
+                return CacheKeyWhitespacePattern.Replace(trimmed, " ");
         }
+        return trimmed;
     }
 
     /// <summary>
@@ -551,11 +577,8 @@ public class KafraClient : IKafraClient
             var url = $"{BaseUrl}/{mobId}/mob.json";
             Debug.WriteLine($"[KafraClient] Fetching monster: {url}");
 
-            var response = await _httpClient.GetStringAsync(url);
-            var monsters = JsonSerializer.Deserialize<List<MonsterInfo>>(response, new JsonSerializerOptions
-            {
-                PropertyNameCaseInsensitive = true
-            });
+            await using var stream = await _httpClient.GetStreamAsync(url);
+            var monsters = await JsonSerializer.DeserializeAsync<List<MonsterInfo>>(stream, _jsonReadOptions);
 
             var monster = monsters?.FirstOrDefault();
             if (monster != null)
@@ -581,7 +604,6 @@ public class KafraClient : IKafraClient
         var results = new List<MonsterInfo>();
         if (string.IsNullOrWhiteSpace(searchTerm)) return results;
 
-        var searchLower = searchTerm.ToLowerInvariant();
         var tasks = new List<Task<MonsterInfo?>>();
 
         // Search a range of monster IDs
@@ -596,13 +618,10 @@ public class KafraClient : IKafraClient
                     var monster = await GetMonsterByIdAsync(mobId);
                     if (monster != null)
                     {
-                        var nameKo = monster.NameKo?.ToLowerInvariant() ?? "";
-                        var nameEn = monster.NameEn?.ToLowerInvariant() ?? "";
-                        var name = monster.Name?.ToLowerInvariant() ?? "";
-
-                        if (nameKo.Contains(searchLower) ||
-                            nameEn.Contains(searchLower) ||
-                            name.Contains(searchLower))
+                        // Case-insensitive compare instead of lowercasing three names per monster
+                        if (monster.NameKo?.Contains(searchTerm, StringComparison.OrdinalIgnoreCase) == true ||
+                            monster.NameEn?.Contains(searchTerm, StringComparison.OrdinalIgnoreCase) == true ||
+                            monster.Name?.Contains(searchTerm, StringComparison.OrdinalIgnoreCase) == true)
                         {
                             return monster;
                         }
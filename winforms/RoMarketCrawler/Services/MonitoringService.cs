@@ -8,6 +8,7 @@ using System.Text.Json;
 using System.Threading;
 using System.Threading.Tasks;
 using RoMarketCrawler.Exceptions;
+using RoMarketCrawler.Helpers;
 using RoMarketCrawler.Interfaces;
 using RoMarketCrawler.Models;
 
@@ -35,6 +36,15 @@ namespace RoMarketCrawler.Services
         private readonly object _lock = new();
         private bool _disposed;
 
+        private static readonly JsonSerializerOptions _configReadOptions = new()
+        {
+            PropertyNameCaseInsensitive = true
+        };
+        private static readonly JsonSerializerOptions _configWriteOptions = new()
+        {
+            WriteIndented = true
+        };
+
         // Sequential processing delay to prevent API rate limiting (500ms between items)
         private const int RefreshDelayMs = 500;
 
@@ -46,17 +56,30 @@ namespace RoMarketCrawler.Services
         // Prevents transient HTTP errors from poisoning the cache for 3 hours
         private const int PriceStatsNullCacheExpirationMinutes = 5;
 
+        // Cache TTLs in milliseconds, compared against Environment.TickCount64
+        private const long PriceStatsCacheTtlMs = PriceStatsCacheExpirationHours * 60L * 60 * 1000;
+        private const long PriceStatsNullCacheTtlMs = PriceStatsNullCacheExpirationMinutes * 60L * 1000;
+
         // Session-level cache for price statistics (yesterday/weekly averages) with TTL
-        // Key: "{priceListMatch}|{priceServerId}", Value: (PriceStatistics, CachedAt timestamp)
+        // Key: (priceListMatch, priceServerId), Value: (PriceStatistics, CachedAt tick count in ms)
         // Avoids duplicate API calls when same item name is monitored across different servers
         // Cache entries expire after PriceStatsCacheExpirationHours
-        private readonly ConcurrentDictionary<string, (PriceStatistics? Stats, DateTime CachedAt)> _priceStatsCache = new(StringComparer.OrdinalIgnoreCase);
+        // Timestamps use Environment.TickCount64 (monotonic) so age checks are a plain integer compare
+        // and are not affected by system clock adjustments
+        private readonly ConcurrentDictionary<(string Name, int ServerId), (PriceStatistics? Stats, long CachedAtMs)> _priceStatsCache = new(NameServerKeyComparer.Instance);
 
         // Session-level cache for price list match results with TTL
-        // Key: "{searchName}|{priceServerId}", Value: (matched item name or null, CachedAt timestamp)
+        // Key: (searchName, priceServerId), Value: (matched item name or null, CachedAt tick count in ms)
         // Avoids repeated SearchPriceListAsync calls when stats are already cached
         // Cache entries expire together with _priceStatsCache (same TTL)
-        private readonly ConcurrentDictionary<string, (string? Match, DateTime CachedAt)> _priceListMatchCache = new(StringComparer.OrdinalIgnoreCase);
+        private readonly ConcurrentDictionary<(string Name, int ServerId), (string? Match, long CachedAtMs)> _priceListMatchCache = new(NameServerKeyComparer.Instance);
+
+        // In-flight price history fetches keyed like _priceStatsCache
+        // Concurrent refreshes (queue processor + manual refresh-all) that miss the cache for the
+        // same key await the first caller's fetch instead of issuing duplicate GNJOY requests
+        private readonly ConcurrentDictionary<(string Name, int ServerId), Lazy<Task<PriceStatistics?>>> _priceStatsInflight = new(NameServerKeyComparer.Instance);
+
+        private readonly CoalescingFileWriter _configWriter;
 
         /// <summary>
         /// Creates MonitoringService with its own dedicated GnjoyClient.
@@ -69,6 +92,7 @@ namespace RoMarketCrawler.Services
             var dataDir = dataDirectory ?? Path.Combine(AppContext.BaseDirectory, "Data");
             Directory.CreateDirectory(dataDir);
             _configFilePath = Path.Combine(dataDir, "MonitorConfig.json");
+            _configWriter = new CoalescingFileWriter(_configFilePath);
             _config = new MonitorConfig();
             _results = new Dictionary<string, MonitorResult>(StringComparer.OrdinalIgnoreCase);
         }
@@ -83,6 +107,7 @@ namespace RoMarketCrawler.Services
             var dataDir = dataDirectory ?? Path.Combine(AppContext.BaseDirectory, "Data");
             Directory.CreateDirectory(dataDir);
             _configFilePath = Path.Combine(dataDir, "MonitorConfig.json");
+            _configWriter = new CoalescingFileWriter(_configFilePath);
             _config = new MonitorConfig();
             _results = new Dictionary<string, MonitorResult>(StringComparer.OrdinalIgnoreCase);
         }
@@ -135,10 +160,7 @@ namespace RoMarketCrawler.Services
                 }
 
                 var json = await File.ReadAllTextAsync(_configFilePath);
-                var config = JsonSerializer.Deserialize<MonitorConfig>(json, new JsonSerializerOptions
-                {
-                    PropertyNameCaseInsensitive = true
-                });
+                var config = JsonSerializer.Deserialize<MonitorConfig>(json, _configReadOptions);
 
                 if (config != null)
                 {
@@ -159,11 +181,17 @@ namespace RoMarketCrawler.Services
         {
             try
             {
-                var json = JsonSerializer.Serialize(_config, new JsonSerializerOptions
+                // Snapshot and version together so a newer version always carries a newer snapshot
+                string json;
+                long version;
+                lock (_lock)
                 {
-                    WriteIndented = true
-                });
-                await File.WriteAllTextAsync(_configFilePath, json);
+                    json = JsonSerializer.Serialize(_config, _configWriteOptions);
+                    version = _configWriter.NextVersion();
+                }
+
+                if (!await _configWriter.WriteAsync(json, version))
+                    return;
                 Debug.WriteLine($"[MonitoringService] Saved {_config.Items.Count} items to config");
             }
             catch (Exception ex)
@@ -249,6 +277,37 @@ namespace RoMarketCrawler.Services
             return true;
         }
 
+        /// <summary>
+        /// Remove several items from the monitoring list with a single config save
+        /// </summary>
+        public async Task<int> RemoveItemsAsync(IEnumerable<(string ItemName, int ServerId)> items)
+        {
+            var removed = 0;
+            foreach (var (itemName, serverId) in items)
+            {
+                var item = _config.Items.FirstOrDefault(i =>
+                    i.ItemName.Equals(itemName, StringComparison.OrdinalIgnoreCase) && i.ServerId == serverId);
+
+                if (item == null)
+                    continue;
+
+                _config.Items.Remove(item);
+
+                lock (_lock)
+                {
+                    _results.Remove(GetResultKey(itemName, serverId));
+                }
+                removed++;
+            }
+
+            if (removed == 0)
+                return 0;
+
+            await SaveConfigAsync();
+            Debug.WriteLine($"[MonitoringService] Removed {removed} items");
+            return removed;
+        }
+
         /// <summary>
         /// Update the server ID of an existing monitored item
         /// </summary>
@@ -705,11 +764,11 @@ namespace RoMarketCrawler.Services
                     Debug.WriteLine($"[MonitoringService] Search name: '{searchName}' for '{dealItemName}'");
 
                     // Resolve priceListMatch — use cache to avoid SearchPriceListAsync on every refresh
-                    var matchCacheKey = $"{searchName}|{priceServerId}";
+                    var matchCacheKey = (searchName, priceServerId);
                     string? priceListMatch;
 
                     if (_priceListMatchCache.TryGetValue(matchCacheKey, out var cachedMatch)
-                        && (DateTime.Now - cachedMatch.CachedAt).TotalHours < PriceStatsCacheExpirationHours)
+                        && Environment.TickCount64 - cachedMatch.CachedAtMs < PriceStatsCacheTtlMs)
                     {
                         priceListMatch = cachedMatch.Match;
                         Debug.WriteLine($"[MonitoringService] Using cached match for '{searchName}': '{priceListMatch}'");
@@ -719,7 +778,7 @@ namespace RoMarketCrawler.Services
                         var priceListItems = await _gnjoyClient.SearchPriceListAsync(searchName, priceServerId, cancellationToken);
                         Debug.WriteLine($"[MonitoringService] Price list returned {priceListItems.Count} items for '{searchName}'");
                         priceListMatch = priceListItems.Count > 0 ? FindBestPriceListMatch(dealItemName, priceListItems) : null;
-                        _priceListMatchCache[matchCacheKey] = (priceListMatch, DateTime.Now);
+                        _priceListMatchCache[matchCacheKey] = (priceListMatch, Environment.TickCount64);
                         Debug.WriteLine($"[MonitoringService] Cached match for '{searchName}': '{priceListMatch}'");
                     }
 
@@ -729,21 +788,21 @@ namespace RoMarketCrawler.Services
                     {
                         Debug.WriteLine($"[MonitoringService] Match found: '{priceListMatch}'");
 
-                        var statsCacheKey = $"{priceListMatch}|{priceServerId}";
+                        var statsCacheKey = (priceListMatch, priceServerId);
                         var cacheHit = false;
 
                         if (_priceStatsCache.TryGetValue(statsCacheKey, out var cached))
                         {
-                            var cacheAge = DateTime.Now - cached.CachedAt;
+                            var cacheAgeMs = Environment.TickCount64 - cached.CachedAtMs;
                             var isExpired = cached.Stats == null
-                                ? cacheAge.TotalMinutes >= PriceStatsNullCacheExpirationMinutes
-                                : cacheAge.TotalHours >= PriceStatsCacheExpirationHours;
+                                ? cacheAgeMs >= PriceStatsNullCacheTtlMs
+                                : cacheAgeMs >= PriceStatsCacheTtlMs;
 
                             if (!isExpired)
                             {
                                 stats = cached.Stats;
                                 cacheHit = true;
-                                Debug.WriteLine($"[MonitoringService] Using cached stats for '{priceListMatch}' (age: {cacheAge.TotalMinutes:F0}min): Yesterday={stats?.YesterdayAvgPrice:N0}, Week={stats?.Week7AvgPrice:N0}");
+                                Debug.WriteLine($"[MonitoringService] Using cached stats for '{priceListMatch}' (age: {cacheAgeMs / 60000}min): Yesterday={stats?.YesterdayAvgPrice:N0}, Week={stats?.Week7AvgPrice:N0}");
                             }
                             else
                             {
@@ -754,9 +813,7 @@ namespace RoMarketCrawler.Services
 
                         if (!cacheHit)
                         {
-                            stats = await _gnjoyClient.FetchPriceHistoryAsync(priceListMatch, priceServerId, cancellationToken);
-                            _priceStatsCache[statsCacheKey] = (stats, DateTime.Now);
-                            Debug.WriteLine($"[MonitoringService] Fetched and cached stats for '{priceListMatch}': Yesterday={stats?.YesterdayAvgPrice:N0}, Week={stats?.Week7AvgPrice:N0}");
+                            stats = await FetchPriceStatsAsync(priceListMatch, priceServerId, statsCacheKey, cancellationToken);
                         }
                     }
                     else
@@ -799,6 +856,73 @@ namespace RoMarketCrawler.Services
             return result;
         }
 
+        /// <summary>
+        /// Fetch price history and store it in _priceStatsCache.
+        /// Only one fetch per cache key runs at a time; concurrent callers share its result.
+        /// The shared fetch is not tied to any caller's token: each caller, including the one that
+        /// started it, only stops waiting when its own token is cancelled.
+        /// </summary>
+        private async Task<PriceStatistics?> FetchPriceStatsAsync(
+            string priceListMatch,
+            int priceServerId,
+            (string Name, int ServerId) statsCacheKey,
+            CancellationToken cancellationToken)
+        {
+            for (var attempt = 0; ; attempt++)
+            {
+                // Join an existing fetch without allocating a Lazy/closure that would just be discarded
+                if (_priceStatsInflight.TryGetValue(statsCacheKey, out var inflight))
+                {
+                    Debug.WriteLine($"[MonitoringService] Joining in-flight stats fetch for '{priceListMatch}'");
+                }
+                else
+                {
+                    Lazy<Task<PriceStatistics?>>? fetch = null;
+                    fetch = new Lazy<Task<PriceStatistics?>>(() =>
+                        FetchAndCachePriceStatsAsync(priceListMatch, priceServerId, statsCacheKey, fetch!));
+
+                    inflight = _priceStatsInflight.GetOrAdd(statsCacheKey, fetch);
+                    if (inflight != fetch)
+                        Debug.WriteLine($"[MonitoringService] Joining in-flight stats fetch for '{priceListMatch}'");
+                }
+
+                var shared = inflight.Value;
+                try
+                {
+                    return await shared.WaitAsync(cancellationToken);
+                }
+                catch (OperationCanceledException) when (attempt == 0 && shared.IsCanceled && !cancellationToken.IsCancellationRequested)
+                {
+                    // The shared fetch was cancelled without this caller asking (e.g. HTTP timeout);
+                    // its entry is already gone, so start a fresh one once
+                    Debug.WriteLine($"[MonitoringService] Shared stats fetch for '{priceListMatch}' was cancelled, retrying");
+                }
+            }
+        }
+
+        /// <summary>
+        /// Body of a shared in-flight stats fetch. Runs on no caller's token and removes its own
+        /// _priceStatsInflight entry however it ends, so later callers never join a finished fetch.
+        /// </summary>
+        private async Task<PriceStatistics?> FetchAndCachePriceStatsAsync(
+            string priceListMatch,
+            int priceServerId,
+            (string Name, int ServerId) statsCacheKey,
+            Lazy<Task<PriceStatistics?>> self)
+        {
+            try
+            {
+                var fetched = await _gnjoyClient.FetchPriceHistoryAsync(priceListMatch, priceServerId, CancellationToken.None);
+                _priceStatsCache[statsCacheKey] = (fetched, Environment.TickCount64);
+                Debug.WriteLine($"[MonitoringService] Fetched and cached stats for '{priceListMatch}': Yesterday={fetched?.YesterdayAvgPrice:N0}, Week={fetched?.Week7AvgPrice:N0}");
+                return fetched;
+            }
+            finally
+            {
+                _priceStatsInflight.TryRemove(new KeyValuePair<(string Name, int ServerId), Lazy<Task<PriceStatistics?>>>(statsCacheKey, self));
+            }
+        }
+
         /// <summary>
         /// Get result for a specific item
         /// </summary>
@@ -936,6 +1060,22 @@ namespace RoMarketCrawler.Services
             return $"{itemName}|{serverId}";
         }
 
+        /// <summary>
+        /// Case-insensitive comparer for (item name, server ID) cache keys.
+        /// Lets the price caches key on the tuple directly instead of formatting a "{name}|{server}"
+        /// string on every lookup.
+        /// </summary>
+        private sealed class NameServerKeyComparer : IEqualityComparer<(string Name, int ServerId)>
+        {
+            public static readonly NameServerKeyComparer Instance = new();
+
+            public bool Equals((string Name, int ServerId) x, (string Name, int ServerId) y)
+                => x.ServerId == y.ServerId && StringComparer.OrdinalIgnoreCase.Equals(x.Name, y.Name);
+
+            public int GetHashCode((string Name, int ServerId) key)
+                => HashCode.Combine(StringComparer.OrdinalIgnoreCase.GetHashCode(key.Name), key.ServerId);
+        }
+
         public void Dispose()
         {
             if (_disposed) return;
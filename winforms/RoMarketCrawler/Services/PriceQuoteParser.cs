@@ -61,8 +61,8 @@ public class PriceQuoteParser
                 return ParseFromText(html);
             }
 
-            var rows = table.SelectNodes(".//tr");
-            if (rows == null || rows.Count < 2)
+            var rows = table.Descendants("tr").ToList();
+            if (rows.Count < 2)
             {
                 return ParseFromText(html);
             }
@@ -70,8 +70,8 @@ public class PriceQuoteParser
             // Skip header row
             foreach (var row in rows.Skip(1))
             {
-                var cells = row.SelectNodes(".//td");
-                if (cells == null || cells.Count < 4)
+                var cells = row.Descendants("td").ToList();
+                if (cells.Count < 4)
                 {
                     continue;
                 }
@@ -100,7 +100,7 @@ public class PriceQuoteParser
         return history;
     }
 
-    private PriceHistory? ParsePriceRow(HtmlNodeCollection cells)
+    private PriceHistory? ParsePriceRow(List<HtmlNode> cells)
     {
         try
         {
@@ -193,9 +193,18 @@ public class PriceQuoteParser
 
     private long ParsePrice(string text)
     {
-        // Remove commas, 'z' (zeny), spaces, and other non-numeric chars
-        var clean = Regex.Replace(text, @"[^0-9]", "");
-        return string.IsNullOrEmpty(clean) ? 0 : long.Parse(clean);
+        // Skip commas, 'z' (zeny), spaces, and other non-numeric chars while accumulating the digits
+        // (no intermediate string; out-of-range values still yield 0 like the old long.TryParse)
+        long price = 0;
+        foreach (var c in text)
+        {
+            if (!char.IsAsciiDigit(c)) continue;
+
+            var digit = c - '0';
+            if (price > (long.MaxValue - digit) / 10) return 0;
+            price = price * 10 + digit;
+        }
+        return price;
     }
 
     /// <summary>
@@ -275,8 +284,8 @@ public class PriceQuoteParser
                 return items;
             }
 
-            var rows = table.SelectNodes(".//tr");
-            if (rows == null || rows.Count < 2)
+            var rows = table.Descendants("tr").ToList();
+            if (rows.Count < 2)
             {
                 return items;
             }
@@ -284,8 +293,8 @@ public class PriceQuoteParser
             // Skip header row
             foreach (var row in rows.Skip(1))
             {
-                var cells = row.SelectNodes(".//td");
-                if (cells == null || cells.Count < 2)
+                var cells = row.Descendants("td").ToList();
+                if (cells.Count < 2)
                 {
                     continue;
                 }
@@ -296,7 +305,7 @@ public class PriceQuoteParser
 
                     // Get exact item name from img alt attribute (most reliable)
                     string? exactItemName = null;
-                    var img = itemCell.SelectSingleNode(".//img[@alt]");
+                    var img = itemCell.Descendants("img").FirstOrDefault(n => n.Attributes.Contains("alt"));
                     if (img != null)
                     {
                         exactItemName = img.GetAttributeValue("alt", "");
@@ -306,11 +315,11 @@ public class PriceQuoteParser
                     // Fallback: get from link text or span
                     if (string.IsNullOrEmpty(exactItemName))
                     {
-                        var link = itemCell.SelectSingleNode(".//a");
+                        var link = itemCell.Descendants("a").FirstOrDefault();
                         if (link != null)
                         {
                             // Try to get from span inside link
-                            var span = link.SelectSingleNode(".//span");
+                            var span = link.Descendants("span").FirstOrDefault();
                             exactItemName = System.Net.WebUtility.HtmlDecode(span?.InnerText.Trim() ?? link.InnerText.Trim());
                         }
                     }
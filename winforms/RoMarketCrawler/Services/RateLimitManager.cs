@@ -10,7 +10,9 @@ namespace RoMarketCrawler.Services;
 public class RateLimitManager : IRateLimitManager
 {
     private readonly object _lock = new();
-    private DateTime? _rateLimitedUntil;
+    // Lockout end as local-time ticks (0 = not limited). Stored as a long so the status
+    // properties, checked before every request and by the UI status timer, read it without the lock.
+    private long _rateLimitedUntilTicks;
     private int _requestCount;
     private DateTime _counterStartTime = DateTime.Now;
 
@@ -22,10 +24,8 @@ public class RateLimitManager : IRateLimitManager
     {
         get
         {
-            lock (_lock)
-            {
-                return _rateLimitedUntil;
-            }
+            var ticks = Interlocked.Read(ref _rateLimitedUntilTicks);
+            return ticks == 0 ? null : new DateTime(ticks, DateTimeKind.Local);
         }
     }
 
@@ -34,10 +34,8 @@ public class RateLimitManager : IRateLimitManager
     {
         get
         {
-            lock (_lock)
-            {
-                return _rateLimitedUntil.HasValue && DateTime.Now < _rateLimitedUntil.Value;
-            }
+            var ticks = Interlocked.Read(ref _rateLimitedUntilTicks);
+            return ticks != 0 && DateTime.Now.Ticks < ticks;
         }
     }
 
@@ -46,12 +44,11 @@ public class RateLimitManager : IRateLimitManager
     {
         get
         {
-            lock (_lock)
-            {
-                if (!_rateLimitedUntil.HasValue || DateTime.Now >= _rateLimitedUntil.Value)
-                    return 0;
-                return (int)(_rateLimitedUntil.Value - DateTime.Now).TotalSeconds;
-            }
+            var ticks = Interlocked.Read(ref _rateLimitedUntilTicks);
+            var now = DateTime.Now.Ticks;
+            if (ticks == 0 || now >= ticks)
+                return 0;
+            return (int)TimeSpan.FromTicks(ticks - now).TotalSeconds;
         }
     }
 
@@ -87,11 +84,9 @@ public class RateLimitManager : IRateLimitManager
     /// <inheritdoc/>
     public void SetRateLimit()
     {
-        lock (_lock)
-        {
-            _rateLimitedUntil = DateTime.Now.AddHours(LockoutHours);
-            Debug.WriteLine($"[RateLimitManager] Rate limited for {LockoutHours}h (until {_rateLimitedUntil})");
-        }
+        var until = DateTime.Now.AddHours(LockoutHours);
+        Interlocked.Exchange(ref _rateLimitedUntilTicks, until.Ticks);
+        Debug.WriteLine($"[RateLimitManager] Rate limited for {LockoutHours}h (until {until})");
 
         RaiseRateLimitChanged();
     }
@@ -99,18 +94,18 @@ public class RateLimitManager : IRateLimitManager
     /// <inheritdoc/>
     public void SetRateLimitUntil(DateTime until)
     {
-        lock (_lock)
+        // Ticks are stored as local time; a restored UTC value must be converted first
+        until = until.Kind == DateTimeKind.Utc ? until.ToLocalTime() : until;
+
+        if (until > DateTime.Now)
         {
-            if (until > DateTime.Now)
-            {
-                _rateLimitedUntil = until;
-                Debug.WriteLine($"[RateLimitManager] Rate limit restored (until {_rateLimitedUntil})");
-            }
-            else
-            {
-                _rateLimitedUntil = null;
-                Debug.WriteLine("[RateLimitManager] Stored rate limit already expired, ignoring");
-            }
+            Interlocked.Exchange(ref _rateLimitedUntilTicks, until.Ticks);
+            Debug.WriteLine($"[RateLimitManager] Rate limit restored (until {until})");
+        }
+        else
+        {
+            Interlocked.Exchange(ref _rateLimitedUntilTicks, 0);
+            Debug.WriteLine("[RateLimitManager] Stored rate limit already expired, ignoring");
         }
 
         RaiseRateLimitChanged();
@@ -119,13 +114,8 @@ public class RateLimitManager : IRateLimitManager
     /// <inheritdoc/>
     public void ClearRateLimit()
     {
-        bool wasLimited;
-        lock (_lock)
-        {
-            wasLimited = _rateLimitedUntil.HasValue;
-            _rateLimitedUntil = null;
-            Debug.WriteLine("[RateLimitManager] Rate limit cleared");
-        }
+        var wasLimited = Interlocked.Exchange(ref _rateLimitedUntilTicks, 0) != 0;
+        Debug.WriteLine("[RateLimitManager] Rate limit cleared");
 
         if (wasLimited)
         {
@@ -15,6 +15,7 @@ public class SettingsService : ISettingsService
     private readonly object _lock = new();
     private AppSettings _settings = new();
     private bool _isDirty = false;
+    private static readonly JsonSerializerOptions _jsonWriteOptions = new() { WriteIndented = true };
 
     /// <inheritdoc/>
     public event EventHandler<SettingChangedEventArgs>? SettingChanged;
@@ -236,7 +237,7 @@ public class SettingsService : ISettingsService
                 _isDirty = false;
             }
 
-            var json = JsonSerializer.Serialize(settingsCopy, new JsonSerializerOptions { WriteIndented = true });
+            var json = JsonSerializer.Serialize(settingsCopy, _jsonWriteOptions);
             await File.WriteAllTextAsync(_settingsFilePath, json).ConfigureAwait(false);
             Debug.WriteLine($"[SettingsService] Saved settings to {_settingsFilePath}");
         }
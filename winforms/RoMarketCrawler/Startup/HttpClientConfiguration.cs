@@ -24,6 +24,12 @@ public static class HttpClientConfiguration
     /// </summary>
     public const string ImageClient = "ImageClient";
 
+    /// <summary>
+    /// Upper bound for a buffered item image response. Item icons and collection art are a few KB,
+    /// so anything larger is a broken or hostile response and is rejected before it is held in memory.
+    /// </summary>
+    public const int MaxImageResponseBytes = 1024 * 1024;
+
     /// <summary>
     /// Configure all named HttpClients for the application
     /// </summary>
@@ -33,6 +39,8 @@ public static class HttpClientConfiguration
         services.AddHttpClient(GnjoyClient, client =>
         {
             client.Timeout = TimeSpan.FromSeconds(30);
+            client.DefaultRequestVersion = HttpVersion.Version20;
+            client.DefaultVersionPolicy = HttpVersionPolicy.RequestVersionOrLower;
             client.DefaultRequestHeaders.UserAgent.ParseAdd("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36");
             client.DefaultRequestHeaders.Accept.ParseAdd("text/html, application/json");
             client.DefaultRequestHeaders.AcceptLanguage.ParseAdd("ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7");
@@ -65,6 +73,7 @@ public static class HttpClientConfiguration
         services.AddHttpClient(ImageClient, client =>
         {
             client.Timeout = TimeSpan.FromSeconds(15);
+            client.MaxResponseContentBufferSize = MaxImageResponseBytes;
             client.DefaultRequestHeaders.UserAgent.ParseAdd("Mozilla/5.0");
         })
         .ConfigurePrimaryHttpMessageHandler(() => new SocketsHttpHandler